@@ -14,6 +14,7 @@ from .converters import (
     list_to_numpy,
     numpy_to_list,
 )
+from .expressions import parse_expression, numeric_function
 from .batch_models import BatchOperation, OperationResult, BatchSummary, BatchResponse
 from .batch_executor import BatchExecutor
 from .result_resolver import ResultResolver
@@ -35,6 +36,9 @@ __all__ = [
     "polars_to_pandas",
     "list_to_numpy",
     "numpy_to_list",
+    # Expressions
+    "parse_expression",
+    "numeric_function",
     # Batch execution
     "BatchOperation",
     "OperationResult",
@@ -3,11 +3,13 @@
 import asyncio
 import json
 import time
-from graphlib import TopologicalSorter, CycleError
-from typing import Any, Dict, List, Literal, Set
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from mcp.types import TextContent
+from pydantic_core import from_json
 
 from .batch_models import BatchOperation, OperationResult, BatchSummary, BatchResponse
-from .result_resolver import ResultResolver
+from .result_resolver import CompiledRef, ResultResolver
 
 
 class BatchExecutor:
@@ -16,10 +18,11 @@ class BatchExecutor:
     Supports three execution modes:
     - sequential: Operations execute in order specified
     - parallel: All operations execute concurrently (ignoring dependencies)
-    - auto: Build DAG from dependencies and execute in optimal wave-based manner
+    - auto: Build DAG from dependencies and start each operation as soon as its
+      dependencies finish (wave by wave when stop_on_error is set)
 
-    Uses Python's graphlib.TopologicalSorter for dependency resolution and
-    asyncio for parallel execution within each wave.
+    Uses Kahn's algorithm over integer-indexed operations for dependency resolution
+    and asyncio tasks bounded by a semaphore for concurrent execution.
     """
 
     def __init__(
@@ -50,8 +53,27 @@ class BatchExecutor:
         self.operation_results: List[OperationResult] = []  # Final results
         self.errors: Dict[str, Exception] = {}
 
-        # Timing
-        self.start_time: float = 0
+        # One resolver for the whole batch: stored results are never replaced, so a
+        # reference used by several operations is navigated once
+        compiled_refs: Dict[str, CompiledRef] = {}
+        for op in operations:
+            compiled_refs.update(op.compiled_refs)
+        self._resolver = ResultResolver(self.results, compiled_refs)
+
+        # Per-batch memo of successful tool outputs keyed by (tool, canonical args).
+        # All registered tools are pure math, so identical calls yield identical results.
+        # Scoped to this executor instance (never global) to respect tool side-effects.
+        self._result_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # Shared concurrency limit for parallel and auto modes
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+        # Outcome counters, updated as each operation completes
+        self.succeeded: int = 0
+        self.failed: int = 0  # Errors and timeouts
+
+        # Timing (monotonic perf_counter_ns nanoseconds; converted to ms for results)
+        self.start_time: int = 0
         self.num_waves: int = 0
 
     async def execute(self) -> BatchResponse:
@@ -60,7 +82,7 @@ class BatchExecutor:
         Returns:
             BatchResponse with results and summary
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
 
         # Execute based on mode
         if self.mode == "sequential":
@@ -74,12 +96,14 @@ class BatchExecutor:
         return self._build_response()
 
     async def _execute_sequential(self) -> None:
-        """Execute operations in exact order specified (index order)."""
-        # Sort by creation order (Python 3.7+ dict maintains insertion order)
-        op_ids = list(self.operations.keys())
+        """Execute operations in exact order specified (index order).
 
-        for wave_num, op_id in enumerate(op_ids):
-            op = self.operations[op_id]
+        Plain loop with no dependency graph: $refs resolve against the operations
+        that ran earlier in the list.
+        """
+        # Creation order (Python 3.7+ dict maintains insertion order)
+        for wave_num, op in enumerate(self.operations.values()):
+            # No semaphore: only one operation is ever in flight
             result = await self._execute_operation(op, wave=wave_num)
             self.operation_results.append(result)
 
@@ -90,138 +114,212 @@ class BatchExecutor:
 
     async def _execute_parallel(self) -> None:
         """Execute all operations in parallel (ignore dependencies)."""
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        ops = list(self.operations.values())
+        results: List[Optional[OperationResult]] = [None] * len(ops)
 
-        async def bounded_execute(op: BatchOperation) -> OperationResult:
-            async with semaphore:
-                return await self._execute_operation(op, wave=0)
+        async def run(i: int, op: BatchOperation) -> None:
+            # Each result lands in its request slot as soon as it completes
+            results[i] = await self._execute_bounded(op, wave=0)
 
-        # Create tasks for all operations
-        tasks = [bounded_execute(op) for op in self.operations.values()]
+        # _execute_operation turns failures into error results, so the group only
+        # aborts on cancellation
+        async with asyncio.TaskGroup() as group:
+            for i, op in enumerate(ops):
+                group.create_task(run(i, op))
 
-        # Execute all in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        for result in results:
-            if isinstance(result, Exception):
-                # Shouldn't happen as _execute_operation catches exceptions
-                # but handle just in case
-                continue
-            if isinstance(result, OperationResult):
-                self.operation_results.append(result)
+        self.operation_results.extend(result for result in results if result is not None)
 
         self.num_waves = 1
 
     async def _execute_auto(self) -> None:
         """Execute with dependency-aware parallelization using DAG.
 
-        Uses TopologicalSorter to identify execution waves.
-        Operations within a wave execute in parallel.
+        Operations start as soon as all of their dependencies have finished rather
+        than waiting for the rest of their wave. Wave numbers (longest dependency
+        chain) are computed up front for result metadata and ordering.
+
+        With stop_on_error, waves run one at a time instead (see _execute_waves), so
+        nothing from a later wave starts before an earlier wave is known to be clean.
         """
-        # Build dependency graph
-        try:
-            sorter = self._build_dependency_graph()
-            sorter.prepare()
-        except CycleError as e:
-            # Extract cycle information
-            cycle = e.args[1] if len(e.args) > 1 else []
-            raise ValueError(
-                f"Circular dependency detected in operations: {' -> '.join(cycle)}. "
-                "Operations cannot depend on themselves directly or indirectly."
-            )
+        levels, successors = self._build_dependency_graph()
+        ops = list(self.operations.values())
 
-        wave_num = 0
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        if self.stop_on_error:
+            await self._execute_waves(ops, levels)
+            return
 
-        # Execute wave by wave
-        while sorter.is_active():
-            ready_ids = list(sorter.get_ready())
+        # Remaining unfinished dependencies per operation
+        waiting = [0] * len(ops)
+        for succ_list in successors:
+            for succ in succ_list:
+                waiting[succ] += 1
 
-            if not ready_ids:
-                # This shouldn't happen with a valid DAG, but be defensive
-                break
+        running: Dict[asyncio.Task, int] = {}
+
+        def start(i: int) -> None:
+            task = asyncio.create_task(self._execute_bounded(ops[i], wave=levels[i]))
+            running[task] = i
 
-            # Execute current wave in parallel
-            async def bounded_execute(op_id: str) -> OperationResult:
-                async with semaphore:
-                    op = self.operations[op_id]
-                    return await self._execute_operation(op, wave=wave_num)
+        for i, count in enumerate(waiting):
+            if count == 0:
+                start(i)
 
-            tasks = [bounded_execute(op_id) for op_id in ready_ids]
-            wave_results = await asyncio.gather(*tasks, return_exceptions=True)
+        finished: List[Tuple[int, OperationResult]] = []
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    i = running.pop(task)
+                    try:
+                        finished.append((i, task.result()))
+                    except Exception as e:
+                        # Unexpected exception (shouldn't happen)
+                        self.errors[ops[i].id] = e
+
+                    # Release dependents whose last dependency just finished
+                    for succ in successors[i]:
+                        waiting[succ] -= 1
+                        if waiting[succ] == 0:
+                            start(succ)
+        finally:
+            for task in running:
+                task.cancel()
+
+        # Report in wave order, then request order within a wave
+        finished.sort(key=lambda item: (levels[item[0]], item[0]))
+        self.operation_results.extend(result for _, result in finished)
+
+        self.num_waves = max((levels[i] for i, _ in finished), default=-1) + 1
+
+    async def _execute_waves(self, ops: List[BatchOperation], levels: List[int]) -> None:
+        """Execute auto mode wave by wave, halting after the first wave with an error.
+
+        Every operation in a wave runs (concurrently) before the next wave starts.
+        When a wave contains an error, no later wave runs and num_waves counts only
+        the waves completed before it.
+
+        Args:
+            ops: Operations in request order
+            levels: Wave number per operation, from _build_dependency_graph
+        """
+        waves: List[List[int]] = [[] for _ in range(max(levels, default=-1) + 1)]
+        for i, level in enumerate(levels):
+            waves[level].append(i)
+
+        for wave_num, members in enumerate(waves):
+            wave_results = await asyncio.gather(
+                *(self._execute_bounded(ops[i], wave=wave_num) for i in members),
+                return_exceptions=True,
+            )
 
-            # Process wave results
             should_stop = False
-            for op_id, result in zip(ready_ids, wave_results):
-                if isinstance(result, Exception):
-                    # Unexpected exception (shouldn't happen)
-                    self.errors[op_id] = result
-                    if self.stop_on_error:
-                        should_stop = True
-                elif isinstance(result, OperationResult):
+            for i, result in zip(members, wave_results):
+                if isinstance(result, OperationResult):
                     self.operation_results.append(result)
-
-                    if result.status == "error" and self.stop_on_error:
+                    if result.status == "error":
                         should_stop = True
-
-                # Mark operation as done for topological sorter
-                sorter.done(op_id)
+                elif isinstance(result, Exception):
+                    # Unexpected exception (shouldn't happen)
+                    self.errors[ops[i].id] = result
+                    should_stop = True
 
             if should_stop:
-                break
-
-            wave_num += 1
+                self.num_waves = wave_num
+                return
 
-        self.num_waves = wave_num if self.operation_results else 0
+        self.num_waves = len(waves)
 
-    def _build_dependency_graph(self) -> TopologicalSorter:
+    def _build_dependency_graph(self) -> Tuple[List[int], List[List[int]]]:
         """Build DAG from operation dependencies.
 
+        Operations are numbered by position so Kahn's algorithm runs over integer
+        indices and plain lists rather than string-keyed dicts.
+
         Returns:
-            TopologicalSorter configured with operation dependencies
+            Tuple of (wave number per operation, successor indices per operation).
+            An operation's wave is one more than the latest wave among its dependencies.
 
         Raises:
-            ValueError: If dependencies reference non-existent operations
+            ValueError: If dependencies reference non-existent operations or form a cycle
         """
-        graph: Dict[str, List[str]] = {}
+        op_ids = list(self.operations.keys())
+        index = {op_id: i for i, op_id in enumerate(op_ids)}
 
-        for op_id, op in self.operations.items():
-            # Scan arguments for $refs to detect dependencies
-            deps = self._extract_refs_from_value(op.arguments)
+        deps: List[List[int]] = []
+        successors: List[List[int]] = [[] for _ in op_ids]
 
-            # Convert set to list for TopologicalSorter
-            graph[op_id] = list(deps)
+        for i, op_id in enumerate(op_ids):
+            # Dependencies were collected from $refs when the operation was validated
+            refs = self.operations[op_id].dependencies
 
-        # Validate all dependencies exist
-        all_op_ids = set(self.operations.keys())
-        for op_id, dep_list in graph.items():
-            invalid_deps = set(dep_list) - all_op_ids
+            # Validate all dependencies exist
+            invalid_deps = refs.difference(index)
             if invalid_deps:
                 raise ValueError(
                     f"Operation '{op_id}' has dependencies on non-existent operations: "
                     f"{', '.join(sorted(invalid_deps))}. "
-                    f"Available operation IDs: {', '.join(sorted(all_op_ids))}"
+                    f"Available operation IDs: {', '.join(sorted(op_ids))}"
                 )
 
-        return TopologicalSorter(graph)
+            op_deps = [index[dep] for dep in refs]
+            deps.append(op_deps)
+            for dep in op_deps:
+                successors[dep].append(i)
+
+        # Kahn's algorithm, one layer (wave) at a time
+        indegree = [len(op_deps) for op_deps in deps]
+        ready = [i for i, degree in enumerate(indegree) if degree == 0]
+        levels = [0] * len(op_ids)
+        wave = 0
+        scheduled = 0
+
+        while ready:
+            for i in ready:
+                levels[i] = wave
+            wave += 1
+            scheduled += len(ready)
+
+            next_ready = []
+            for i in ready:
+                for succ in successors[i]:
+                    indegree[succ] -= 1
+                    if indegree[succ] == 0:
+                        next_ready.append(succ)
+            ready = next_ready
+
+        if scheduled < len(op_ids):
+            # Every unscheduled operation still waits on another unscheduled one,
+            # so following those dependencies from any of them must loop
+            node = next(i for i, degree in enumerate(indegree) if degree > 0)
+            path: List[int] = []
+            seen: Dict[int, int] = {}
+            while node not in seen:
+                seen[node] = len(path)
+                path.append(node)
+                node = next(dep for dep in deps[node] if indegree[dep] > 0)
+            cycle = [op_ids[i] for i in path[seen[node]:]] + [op_ids[node]]
 
-    def _extract_refs_from_value(self, value: Any) -> Set[str]:
-        """Recursively extract $operation_id references from any value."""
-        refs: Set[str] = set()
+            raise ValueError(
+                f"Circular dependency detected in operations: {' -> '.join(cycle)}. "
+                "Operations cannot depend on themselves directly or indirectly."
+            )
+
+        return levels, successors
+
+    async def _execute_bounded(self, op: BatchOperation, wave: int) -> OperationResult:
+        """Execute a single operation once a concurrency slot is free.
 
-        if isinstance(value, str) and value.startswith('$'):
-            # Extract operation ID from $op_id or $op_id.path
-            op_id = value.split('.')[0][1:]  # Remove $ and take first part
-            refs.add(op_id)
-        elif isinstance(value, dict):
-            for v in value.values():
-                refs.update(self._extract_refs_from_value(v))
-        elif isinstance(value, list):
-            for item in value:
-                refs.update(self._extract_refs_from_value(item))
+        Args:
+            op: Operation to execute
+            wave: Execution wave number (for metadata)
 
-        return refs
+        Returns:
+            OperationResult from _execute_operation
+        """
+        async with self._semaphore:
+            return await self._execute_operation(op, wave=wave)
 
     async def _execute_operation(
         self, op: BatchOperation, wave: int
@@ -235,11 +333,17 @@ class BatchExecutor:
         Returns:
             OperationResult with status, result/error, and metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             # Resolve arguments with dependencies
-            resolved_args = self._resolve_arguments(op)
+            arguments = self._prepare_arguments(op)
+            # Reference-free operations (the common case) skip the resolver entirely.
+            # resolve_sites copies before writing, so op.arguments is never modified
+            if op.ref_sites:
+                resolved_args = self._resolver.resolve_sites(arguments, op.ref_sites)
+            else:
+                resolved_args = arguments
 
             # Get wrapped tool instance (not raw function)
             if op.tool not in self.tool_registry:
@@ -248,28 +352,38 @@ class BatchExecutor:
                     f"Available tools: {', '.join(sorted(self.tool_registry.keys()))}"
                 )
 
-            tool = self.tool_registry[op.tool]
+            # Reuse output of an identical call made earlier in this batch. Keyed on the
+            # unresolved arguments: a $ref always resolves to the same stored result within
+            # a batch, so parent outputs never need to be re-encoded just to build the key
+            cache_key = (op.tool, json.dumps(arguments, sort_keys=True, default=str))
+            cached = self._result_cache.get(cache_key)
 
-            # Execute tool.run() with arguments dict
-            if op.timeout_ms:
-                tool_result = await asyncio.wait_for(
-                    tool.run(resolved_args), timeout=op.timeout_ms / 1000
-                )
+            if cached is not None:
+                # Shallow copy so per-operation context injection doesn't leak
+                result_data = dict(cached)
             else:
-                tool_result = await tool.run(resolved_args)
-
-            # Extract text content from ToolResult
-            from mcp.types import TextContent
-            if tool_result.content and isinstance(tool_result.content[0], TextContent):
-                raw_result = tool_result.content[0].text
-            else:
-                raise ValueError(
-                    f"Unexpected tool result format from {op.tool}. "
-                    f"Expected TextContent, got {type(tool_result.content[0]) if tool_result.content else 'no content'}"
-                )
-
-            # Parse JSON result
-            result_data = json.loads(raw_result)
+                tool = self.tool_registry[op.tool]
+
+                # Execute tool.run() with arguments dict. asyncio.timeout() schedules one
+                # loop.call_at deadline in the current task (no extra Task like wait_for)
+                if op.timeout_ms:
+                    async with asyncio.timeout(op.timeout_ms / 1000):
+                        tool_result = await tool.run(resolved_args)
+                else:
+                    tool_result = await tool.run(resolved_args)
+
+                # Extract text content from ToolResult
+                if tool_result.content and isinstance(tool_result.content[0], TextContent):
+                    raw_result = tool_result.content[0].text
+                else:
+                    raise ValueError(
+                        f"Unexpected tool result format from {op.tool}. "
+                        f"Expected TextContent, got {type(tool_result.content[0]) if tool_result.content else 'no content'}"
+                    )
+
+                # Parse JSON result (pydantic_core's Rust parser; same output as json.loads)
+                result_data = from_json(raw_result)
+                self._result_cache[cache_key] = dict(result_data)
 
             # Inject operation-level context if provided
             if op.context:
@@ -279,22 +393,25 @@ class BatchExecutor:
             self.results[op.id] = result_data
 
             # Calculate execution time
-            execution_time = (time.time() - start_time) * 1000
+            execution_time = (time.perf_counter_ns() - start_time) / 1e6
+            self.succeeded += 1
 
-            return OperationResult(
+            # Fields are produced here rather than by callers, so skip pydantic validation
+            return OperationResult.model_construct(
                 id=op.id,
                 tool=op.tool,
                 status="success",
                 result=result_data,
                 execution_time_ms=execution_time,
                 wave=wave,
-                dependencies=list(self._extract_refs_from_value(op.arguments)),
+                dependencies=list(op.dependencies),
                 label=op.label,
             )
 
         except asyncio.TimeoutError:
-            execution_time = (time.time() - start_time) * 1000
-            return OperationResult(
+            execution_time = (time.perf_counter_ns() - start_time) / 1e6
+            self.failed += 1
+            return OperationResult.model_construct(
                 id=op.id,
                 tool=op.tool,
                 status="timeout",
@@ -305,15 +422,16 @@ class BatchExecutor:
                 },
                 execution_time_ms=execution_time,
                 wave=wave,
-                dependencies=list(self._extract_refs_from_value(op.arguments)),
+                dependencies=list(op.dependencies),
                 label=op.label,
             )
 
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
+            execution_time = (time.perf_counter_ns() - start_time) / 1e6
             self.errors[op.id] = e
+            self.failed += 1
 
-            return OperationResult(
+            return OperationResult.model_construct(
                 id=op.id,
                 tool=op.tool,
                 status="error",
@@ -324,45 +442,42 @@ class BatchExecutor:
                 },
                 execution_time_ms=execution_time,
                 wave=wave,
-                dependencies=list(self._extract_refs_from_value(op.arguments)),
+                dependencies=list(op.dependencies),
                 label=op.label,
             )
 
-    def _resolve_arguments(self, op: BatchOperation) -> Dict[str, Any]:
-        """Resolve operation arguments with result references.
+    def _prepare_arguments(self, op: BatchOperation) -> Dict[str, Any]:
+        """Apply context and output_mode precedence to operation arguments.
 
-        Resolves $refs in arguments.
-        Handles precedence for context and output_mode parameters.
+        $refs are left in place; they are resolved with ResultResolver afterwards.
+        The arguments are only copied when a key has to be dropped; otherwise
+        op.arguments itself is returned and must not be modified.
 
         Args:
-            op: Operation to resolve arguments for
+            op: Operation to prepare arguments for
 
         Returns:
-            Fully resolved arguments dictionary
-
-        Raises:
-            ValueError: If references cannot be resolved
+            Arguments dictionary ready for reference resolution
         """
-        resolver = ResultResolver(self.results)
-
-        # Start with base arguments
-        resolved = op.arguments.copy()
+        prepared = op.arguments
 
         # Handle context precedence: operation-level > arguments-level
         # If operation has context at operation level, remove from arguments
         # (operation-level takes precedence and will be injected after execution)
-        if op.context and 'context' in resolved:
-            del resolved['context']
+        drop_context = bool(op.context) and 'context' in prepared
 
         # Always remove output_mode from arguments to prevent double transformation
         # The batch-level output_mode controls the entire response format
-        if 'output_mode' in resolved:
-            del resolved['output_mode']
+        drop_output_mode = 'output_mode' in prepared
 
-        # Resolve all $refs in argument values
-        resolved = resolver.resolve(resolved)
+        if drop_context or drop_output_mode:
+            prepared = prepared.copy()
+            if drop_context:
+                del prepared['context']
+            if drop_output_mode:
+                del prepared['output_mode']
 
-        return resolved
+        return prepared
 
     def _build_response(self) -> BatchResponse:
         """Build complete batch response with results and summary.
@@ -370,20 +485,16 @@ class BatchExecutor:
         Returns:
             BatchResponse with all results and execution statistics
         """
-        total_time = (time.time() - self.start_time) * 1000
-
-        # Count successes and failures
-        succeeded = sum(1 for r in self.operation_results if r.status == "success")
-        failed = sum(1 for r in self.operation_results if r.status in ["error", "timeout"])
+        total_time = (time.perf_counter_ns() - self.start_time) / 1e6
 
-        summary = BatchSummary(
+        summary = BatchSummary.model_construct(
             total_operations=len(self.operations),
-            succeeded=succeeded,
-            failed=failed,
+            succeeded=self.succeeded,
+            failed=self.failed,
             total_execution_time_ms=total_time,
             execution_mode=self.mode,
             num_waves=self.num_waves,
             max_concurrent=self.max_concurrent,
         )
 
-        return BatchResponse(results=self.operation_results, summary=summary)
+        return BatchResponse.model_construct(results=self.operation_results, summary=summary)
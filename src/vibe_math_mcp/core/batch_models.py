@@ -1,9 +1,17 @@
 """Pydantic models for batch operations with comprehensive validation."""
 
-from typing import Any, Dict, List, Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+import string
+import sys
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Set, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
+from pydantic_core import to_json
 from uuid import uuid4
 
+from .result_resolver import CompiledRef, RefSite, compile_refs
+
+# Characters allowed in operation IDs (anything else would break $id references)
+_ID_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
 
 class BatchOperation(BaseModel):
     """Single operation within a batch request.
@@ -12,9 +20,13 @@ class BatchOperation(BaseModel):
     Operations are executed according to their dependencies and the selected execution mode.
     """
 
+    # Read-only once validated: compiled refs and dependencies are derived from arguments
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
-        description="Unique operation identifier (auto-generated UUID if not provided)",
+        # 12 hex chars of a UUID4: short in result JSON, collision-free in practice per batch
+        default_factory=lambda: uuid4().hex[:12],
+        description="Unique operation identifier (auto-generated if not provided)",
         min_length=1,
         max_length=200,
     )
@@ -48,6 +60,11 @@ class BatchOperation(BaseModel):
         le=300000,
     )
 
+    # $references in arguments, parsed once at validation (see compile_references)
+    _compiled_refs: Dict[str, CompiledRef] = PrivateAttr(default_factory=dict)
+    _ref_ops: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _ref_sites: Tuple[RefSite, ...] = PrivateAttr(default=())
+
     @field_validator('tool')
     @classmethod
     def validate_tool_name(cls, v: str) -> str:
@@ -55,21 +72,55 @@ class BatchOperation(BaseModel):
 
         This will be checked at runtime when the tool registry is available.
         Static validation happens in the batch_execute tool itself.
+        Interned so tool registry lookups hit on identity.
         """
-        return v
+        return sys.intern(v)
 
     @field_validator('id')
     @classmethod
     def validate_id_format(cls, v: str) -> str:
         """Validate operation ID format (no special chars that break references)."""
-        import re
-
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _ID_ALLOWED_CHARS.issuperset(v):
             raise ValueError(
                 f"Operation ID '{v}' contains invalid characters. "
                 "Only letters, numbers, underscores, and hyphens are allowed."
             )
-        return v
+        # Interned to match the op_id interned by compile_ref, so results lookups hit on identity
+        return sys.intern(v)
+
+    @model_validator(mode='after')
+    def compile_references(self) -> 'BatchOperation':
+        """Pre-parse $references in arguments once.
+
+        Resolution and dependency detection reuse the result instead of re-walking
+        arguments. Invalid references are left uncompiled and reported when resolved.
+        """
+        # Prefilter in Rust: a string starting with $ always serialises with '"$', so
+        # reference-free arguments (large matrices, plain scalars) skip the Python walk
+        if b'"$' not in to_json(self.arguments, fallback=str):
+            return self
+
+        op_ids: Set[str] = set()
+        sites: List[RefSite] = []
+        compile_refs(self.arguments, self._compiled_refs, op_ids, sites)
+        self._ref_ops = frozenset(op_ids)
+        self._ref_sites = tuple(sites)
+        return self
+
+    @property
+    def compiled_refs(self) -> Dict[str, CompiledRef]:
+        """Map of reference string -> CompiledRef for this operation's arguments."""
+        return self._compiled_refs
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        """IDs of operations referenced by $refs in this operation's arguments."""
+        return self._ref_ops
+
+    @property
+    def ref_sites(self) -> Tuple[RefSite, ...]:
+        """Locations of $refs in this operation's arguments (see ResultResolver.resolve_sites)."""
+        return self._ref_sites
 
 
 class OperationResult(BaseModel):
@@ -78,6 +129,10 @@ class OperationResult(BaseModel):
     Contains the operation's output, status, execution metadata, and any errors.
     """
 
+    # Built once by the executor and never modified. Infinity/NaN are emitted like
+    # json.dumps rather than as pydantic's default null
+    model_config = ConfigDict(frozen=True, ser_json_inf_nan='constants')
+
     id: str = Field(description="Operation identifier matching the request")
 
     tool: str = Field(description="Tool that was executed")
@@ -146,6 +201,9 @@ class BatchResponse(BaseModel):
     transformation layer and appears at the top level of the JSON response.
     """
 
+    # Applies to values inside OperationResult.result too (serialised from the root)
+    model_config = ConfigDict(ser_json_inf_nan='constants')
+
     results: List[OperationResult] = Field(
         description="Results for each operation in execution order"
     )
@@ -0,0 +1,43 @@
+"""Cached SymPy expression parsing and compilation shared by the symbolic tools."""
+
+from functools import lru_cache
+from typing import Any, Callable
+
+from sympy import Basic, Symbol, lambdify, sympify
+
+
+@lru_cache(maxsize=2048)
+def parse_expression(expression: str) -> Basic:
+    """Parse an expression string with sympify, reusing earlier parses.
+
+    SymPy expressions are immutable, so one parsed expression can safely be shared
+    between calls. Parsing usually dominates the cost of a simple evaluation.
+
+    Args:
+        expression: Expression string (e.g., 'x^2 + 1', 'sin(pi/2)')
+
+    Returns:
+        Parsed SymPy expression
+
+    Raises:
+        SympifyError: If the expression cannot be parsed (failures are not cached)
+    """
+    return sympify(expression)
+
+
+@lru_cache(maxsize=512)
+def numeric_function(expression: str, variable: str) -> Callable[..., Any]:
+    """Compile an expression of one variable to a NumPy-backed callable, reusing earlier builds.
+
+    lambdify generates and execs Python source on every call, which costs far more
+    than evaluating the result, so repeated numerical work on one expression
+    compiles it once.
+
+    Args:
+        expression: Expression string (e.g., 'sin(x)')
+        variable: Name of the function's argument (e.g., 'x')
+
+    Returns:
+        Function of one argument evaluating the expression with NumPy
+    """
+    return lambdify(Symbol(variable), parse_expression(expression), "numpy")
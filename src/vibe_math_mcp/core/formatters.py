@@ -1,12 +1,17 @@
 """Response formatting utilities for JSON and Markdown output."""
 
-import json
 from typing import Any, Dict, List, Optional
 
+from pydantic_core import to_json
+
 
 def format_json(data: Dict[str, Any]) -> str:
-    """Format response as clean JSON."""
-    return json.dumps(data, indent=2, default=str)
+    """Format response as clean, compact JSON.
+
+    Serialised by pydantic-core's Rust encoder. NaN/Infinity are written as JSON
+    constants (as json.dumps did) and unknown types fall back to str().
+    """
+    return to_json(data, fallback=str, inf_nan_mode="constants").decode()
 
 
 def format_result(value: Any, metadata: Optional[Dict[str, Any]] = None) -> str:
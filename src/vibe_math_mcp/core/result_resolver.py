@@ -1,7 +1,109 @@
 """Result resolution for batch operations with JSONPath-like syntax."""
 
 import re
-from typing import Any, Dict
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+# Pattern: $operation_id or $operation_id.path.to.field
+# Operation ID can contain letters, numbers, underscores, hyphens
+_REF_PATTERN = re.compile(r'^\$([a-zA-Z0-9_-]+)(?:\.(.+))?$')
+
+# Splits "a.b[0].c" -> ["a", "b", "0", "", "c"] (empty strings filtered by callers)
+_PATH_SEPARATORS = re.compile(r'\.|\[|\]')
+
+
+class CompiledRef(NamedTuple):
+    """A $op_id.path reference parsed into its operation ID and path segments."""
+
+    ref: str
+    op_id: str
+    parts: Tuple[str, ...]
+
+
+@lru_cache(maxsize=512)
+def compile_ref(ref: str) -> Optional[CompiledRef]:
+    """Parse a reference string once so it can be resolved without regex work.
+
+    Cached across batches: clients tend to resend the same reference strings.
+
+    Args:
+        ref: Reference string like $op_id or $op_id.result[0]
+
+    Returns:
+        CompiledRef, or None if the syntax is invalid (reported at resolution time)
+    """
+    match = _REF_PATTERN.match(ref)
+    if not match:
+        return None
+
+    op_id, path = match.groups()
+    parts = tuple(p for p in _PATH_SEPARATORS.split(path) if p) if path else ()
+    # Interned like BatchOperation.id so results[op_id] lookups hit on identity
+    return CompiledRef(ref, sys.intern(op_id), parts)
+
+
+# Location of a $reference inside an argument tree: (keys/indices from the root, ref string)
+RefSite = Tuple[Tuple[Union[str, int], ...], str]
+
+
+def compile_refs(
+    value: Any,
+    compiled: Dict[str, CompiledRef],
+    op_ids: Set[str],
+    sites: List[RefSite],
+    path: Tuple[Union[str, int], ...] = (),
+) -> None:
+    """Collect compiled references, referenced operation IDs and ref sites.
+
+    Walks the tree with an explicit stack, so argument depth is bounded by memory
+    rather than the interpreter recursion limit.
+
+    Args:
+        value: Any value that might contain $references
+        compiled: Map of reference string -> CompiledRef to populate
+        op_ids: Set to populate with every referenced operation ID, including those
+            of references with invalid syntax (so they surface as missing dependencies)
+        sites: List to populate with the location of every $reference, in traversal order
+        path: Location of value within the tree being scanned
+    """
+    stack: List[Tuple[Any, Tuple[Union[str, int], ...]]] = [(value, path)]
+    while stack:
+        item, item_path = stack.pop()
+        if isinstance(item, str):
+            if item.startswith('$'):
+                if item not in compiled:
+                    ref = compile_ref(item)
+                    if ref is not None:
+                        compiled[item] = ref
+                # Operation ID is everything between $ and the first dot
+                op_ids.add(sys.intern(item.split('.')[0][1:]))
+                sites.append((item_path, item))
+        elif isinstance(item, dict):
+            # Pushed in reverse so children pop in document order
+            stack.extend((v, item_path + (k,)) for k, v in reversed(item.items()))
+        elif isinstance(item, list):
+            stack.extend((item[i], item_path + (i,)) for i in range(len(item) - 1, -1, -1))
+
+
+def _has_ref(value: Any) -> bool:
+    """Check whether value contains any $reference, stopping at the first one found."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if item.startswith('$'):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+
+def _copy_container(value: Any) -> Any:
+    """Shallow-copy a dict or list so it can be rebuilt in place."""
+    return dict(value) if isinstance(value, dict) else list(value)
 
 
 class ResultResolver:
@@ -15,16 +117,29 @@ class ResultResolver:
     - Multi-dimensional arrays: $op_id.result[0][1]
     """
 
-    def __init__(self, results: Dict[str, Dict[str, Any]]):
+    def __init__(
+        self,
+        results: Dict[str, Dict[str, Any]],
+        compiled_refs: Optional[Dict[str, CompiledRef]] = None,
+    ):
         """Initialise resolver with completed operation results.
 
+        Successfully resolved references are memoised for the resolver's lifetime, so
+        results may be added to the map later but must not be replaced.
+
         Args:
             results: Map of operation_id -> result dictionary
+            compiled_refs: Optional pre-parsed references (see BatchOperation.compiled_refs)
         """
         self.results = results
+        self.compiled_refs = compiled_refs or {}
+        self._resolved: Dict[str, Any] = {}
 
     def resolve(self, value: Any) -> Any:
-        """Recursively resolve references in value.
+        """Resolve references in value.
+
+        Values without any $reference are returned unchanged (not copied). Otherwise
+        only the dicts/lists that contain references are copied and rebuilt.
 
         Args:
             value: Any value that might contain $references
@@ -32,15 +147,80 @@ class ResultResolver:
         Returns:
             Value with all references resolved to actual values
         """
-        if isinstance(value, str) and value.startswith('$'):
-            return self._resolve_reference(value)
-        elif isinstance(value, dict):
-            return {k: self.resolve(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self.resolve(v) for v in value]
-        else:
+        # Leaf fast path: a plain string needs no container scan
+        if isinstance(value, str):
+            return self._resolve_reference(value) if value.startswith('$') else value
+
+        if not _has_ref(value):
             return value
 
+        # Per-call memo: a container shared between several positions is scanned and
+        # rebuilt once (keyed by id(), valid because the input keeps every original alive)
+        rebuilt: Dict[int, Any] = {}
+
+        # Iterative rebuild: each stack entry is a fresh copy whose children still need resolving
+        root = _copy_container(value)
+        stack = [root]
+        while stack:
+            container = stack.pop()
+            keys = container.keys() if isinstance(container, dict) else range(len(container))
+            for key in keys:
+                item = container[key]
+                if isinstance(item, str):
+                    if item.startswith('$'):
+                        container[key] = self._resolve_reference(item)
+                elif isinstance(item, (dict, list)):
+                    child = rebuilt.get(id(item))
+                    if child is None:
+                        if _has_ref(item):
+                            child = _copy_container(item)
+                            stack.append(child)
+                        else:
+                            child = item
+                        rebuilt[id(item)] = child
+                    container[key] = child
+
+        return root
+
+    def resolve_sites(self, arguments: Dict[str, Any], sites: Sequence[RefSite]) -> Dict[str, Any]:
+        """Resolve references at locations recorded ahead of time (see compile_refs).
+
+        Skips scanning the argument tree: only the containers on the path to each
+        reference are copied, and everything else is shared with the input.
+
+        Args:
+            arguments: Argument dict the sites were recorded from. Top-level keys may
+                have been removed since; sites under a missing key are skipped
+            sites: Reference locations in traversal order
+
+        Returns:
+            Arguments with all references at the given sites resolved
+        """
+        if not sites:
+            return arguments
+
+        root = dict(arguments)
+        copies: Dict[Tuple[Union[str, int], ...], Any] = {(): root}
+
+        for path, ref in sites:
+            if path[0] not in root:
+                continue
+
+            # Copy each container on the way down once, then overwrite the leaf
+            container = root
+            for depth in range(1, len(path)):
+                prefix = path[:depth]
+                child = copies.get(prefix)
+                if child is None:
+                    child = _copy_container(container[path[depth - 1]])
+                    container[path[depth - 1]] = child
+                    copies[prefix] = child
+                container = child
+
+            container[path[-1]] = self._resolve_reference(ref)
+
+        return root
+
     def _resolve_reference(self, ref: str) -> Any:
         """Resolve a single $op_id.path reference.
 
@@ -53,18 +233,18 @@ class ResultResolver:
         Raises:
             ValueError: If reference syntax is invalid or operation not found
         """
-        # Pattern: $operation_id or $operation_id.path.to.field
-        # Operation ID can contain letters, numbers, underscores, hyphens
-        pattern = r'^\$([a-zA-Z0-9_-]+)(?:\.(.+))?$'
-        match = re.match(pattern, ref)
+        if ref in self._resolved:
+            return self._resolved[ref]
 
-        if not match:
+        compiled = self.compiled_refs.get(ref) or compile_ref(ref)
+
+        if compiled is None:
             raise ValueError(
                 f"Invalid reference syntax: '{ref}'. "
                 f"Expected format: $operation_id or $operation_id.path.to.field"
             )
 
-        op_id, path = match.groups()
+        op_id = compiled.op_id
 
         # Check operation exists
         if op_id not in self.results:
@@ -78,12 +258,13 @@ class ResultResolver:
         value = self.results[op_id]
 
         # Navigate path if provided
-        if path:
-            value = self._navigate_path(value, path, ref)
+        if compiled.parts:
+            value = self._navigate_path(value, compiled.parts, ref)
 
+        self._resolved[ref] = value
         return value
 
-    def _navigate_path(self, obj: Any, path: str, original_ref: str) -> Any:
+    def _navigate_path(self, obj: Any, parts: Tuple[str, ...], original_ref: str) -> Any:
         """Navigate nested object/array structure.
 
         Supports:
@@ -93,7 +274,7 @@ class ResultResolver:
 
         Args:
             obj: Starting object to navigate from
-            path: Navigation path (e.g., "result.metadata.rate")
+            parts: Path segments (e.g., ("result", "metadata", "rate"))
             original_ref: Original reference string (for error messages)
 
         Returns:
@@ -102,10 +283,6 @@ class ResultResolver:
         Raises:
             ValueError: If path is invalid or value not found
         """
-        # Split path by dots and brackets: "a.b[0].c" -> ["a", "b", "0", "c"]
-        # This regex splits on . or [ or ], then filters empty strings
-        parts = [p for p in re.split(r'\.|\[|\]', path) if p]
-
         current = obj
         current_path = []
 
@@ -141,6 +318,7 @@ class ResultResolver:
                     )
             else:
                 current_type = type(current).__name__
+                path = original_ref.partition('.')[2]
                 raise ValueError(
                     f"Cannot navigate path '{path}' in {original_ref} at '{path_so_far}': "
                     f"reached non-dict/non-list value of type {current_type}"
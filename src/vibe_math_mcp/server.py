@@ -1,6 +1,7 @@
 """Vibe Math - High-performance mathematical operations using Polars and scientific Python."""
 
 import json
+import os
 from typing import Annotated, Any, Dict, Literal
 
 from fastmcp import FastMCP
@@ -12,6 +13,9 @@ from mcp.types import TextContent
 # Version is defined here to avoid circular import with __init__.py
 __version__ = "2.0.3"
 
+# Pretty-print responses (indent=2) for debugging; compact JSON otherwise
+PRETTY_JSON = os.environ.get("VIBE_MATH_PRETTY") == "1"
+
 
 # ============================================================================
 # Output Transformation Helpers
@@ -211,6 +215,27 @@ def transform_batch_response(data: Dict[str, Any], mode: str) -> Dict[str, Any]:
     return data
 
 
+# Parameters injected into every tool. Defined once at module level so the
+# annotated types are shared by all transformed tools rather than rebuilt per tool.
+ContextParam = Annotated[
+    str | None,
+    Field(
+        description=(
+            "Optional annotation to label this calculation "
+            "(e.g., 'Bond A PV', 'Q2 revenue'). "
+            "Appears in results for easy identification."
+        )
+    ),
+]
+
+OutputModeParam = Annotated[
+    Literal["full", "compact", "minimal", "value", "final"],
+    Field(
+        description="Output format: full (default), compact, minimal, value, or final. See batch_execute tool for details."
+    ),
+]
+
+
 class CustomMCP(FastMCP):
     """Custom FastMCP subclass with automatic context injection and output control.
 
@@ -252,22 +277,8 @@ class CustomMCP(FastMCP):
 
         # Define the unified transform function
         async def unified_transform(
-            context: Annotated[
-                str | None,
-                Field(
-                    description=(
-                        "Optional annotation to label this calculation "
-                        "(e.g., 'Bond A PV', 'Q2 revenue'). "
-                        "Appears in results for easy identification."
-                    )
-                ),
-            ] = None,
-            output_mode: Annotated[
-                Literal["full", "compact", "minimal", "value", "final"],
-                Field(
-                    description="Output format: full (default), compact, minimal, value, or final. See batch_execute tool for details."
-                ),
-            ] = "full",
+            context: ContextParam = None,
+            output_mode: OutputModeParam = "full",
             **kwargs: Any,
         ) -> str:
             """Transform function for context injection and output control.
@@ -298,6 +309,11 @@ class CustomMCP(FastMCP):
                     f"{type(tool_result.content[0]) if tool_result.content else 'no content'}"
                 )
 
+            # Pass-through fast path: nothing to inject or transform, and tools
+            # already emit compact JSON, so skip the parse/re-serialise round trip
+            if context is None and output_mode == "full" and not PRETTY_JSON:
+                return result_str
+
             # Parse JSON result
             try:
                 result_data = json.loads(result_str)
@@ -315,13 +331,10 @@ class CustomMCP(FastMCP):
             else:
                 result_data = transform_single_response(result_data, output_mode)
 
-            # Serialize based on mode
-            if output_mode == "compact":
-                # No indentation for compact mode
-                return json.dumps(result_data, separators=(",", ":"), default=str)
-            else:
-                # Pretty-print for all other modes
+            # Serialize compactly; indentation is only useful to humans debugging
+            if PRETTY_JSON and output_mode != "compact":
                 return json.dumps(result_data, indent=2, default=str)
+            return json.dumps(result_data, separators=(",", ":"), default=str)
 
         # Transform the tool to add context and output_mode handling
         transformed_tool = Tool.from_tool(
@@ -654,7 +667,7 @@ All 21 tools support output_mode parameter for controlling response verbosity (7
 
 2. compact (20-30% reduction)
    Use: production with moderate logging
-   Returns: result + non-null metadata, no indentation (single-line JSON)
+   Returns: result + non-null metadata (null fields removed)
    Single: {"result":42,"context":"..."}
    Batch: compact operation array
 
@@ -697,8 +710,18 @@ __all__ = ["mcp", "basic", "array", "batch", "statistics", "financial", "linalg"
 
 
 def main():
-    """Entry point for uvx."""
-    mcp.run()
+    """Entry point for uvx.
+
+    Runs on uvloop when it is installed (``pip install vibe-math-mcp[uvloop]``),
+    which lowers per-task scheduling overhead for batch_execute. The HTTP entry
+    point gets the same behaviour from uvicorn's default loop selection.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        mcp.run()
+    else:
+        uvloop.run(mcp.run_async())
 
 
 if __name__ == "__main__":
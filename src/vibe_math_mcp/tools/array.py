@@ -137,12 +137,17 @@ async def array_statistics(
     try:
         df = list_to_polars(data)
 
+        # Convert once up front rather than once per requested statistic
+        if axis is None:
+            all_values = df.to_numpy().ravel()
+        elif axis == 1:
+            arr = df.to_numpy()
+
         results = {}
 
         for op in operations:
             if axis is None:
                 # Overall statistics across all values
-                all_values = df.to_numpy().flatten()
                 if op == "mean":
                     results[op] = float(np.mean(all_values))
                 elif op == "median":
@@ -171,7 +176,6 @@ async def array_statistics(
                     results[op] = df.sum().to_numpy()[0].tolist()
             elif axis == 1:
                 # Row-wise statistics
-                arr = df.to_numpy()
                 if op == "mean":
                     results[op] = np.mean(arr, axis=1).tolist()
                 elif op == "median":
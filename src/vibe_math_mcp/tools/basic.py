@@ -3,12 +3,12 @@
 import math
 from typing import Annotated, Dict, Literal, Union, List
 from pydantic import Field
-from sympy import sympify, simplify, N
+from sympy import simplify, N
 from mcp.types import ToolAnnotations
 import numpy as np
 
 from ..server import mcp
-from ..core import format_result
+from ..core import format_result, parse_expression
 
 
 @mcp.tool(
@@ -59,7 +59,7 @@ async def calculate(
 ) -> str:
     """Evaluate mathematical expressions."""
     try:
-        expr = sympify(expression)
+        expr = parse_expression(expression)
 
         if variables:
             result = float(N(expr.subs(variables)))
@@ -189,23 +189,23 @@ async def round_values(
 ) -> str:
     """Advanced rounding operations."""
     try:
-        is_single = isinstance(values, (int, float))
-        vals = [values] if is_single else values
-
-        arr = np.array(vals, dtype=float)
+        # Scalars become 0-d arrays, so one ufunc call covers both input shapes
+        arr = np.asarray(values, dtype=float)
+        scale = 10.0**decimals
 
         if method == "round":
             result = np.round(arr, decimals)
         elif method == "floor":
-            result = np.floor(arr * 10**decimals) / 10**decimals
+            result = np.floor(arr * scale) / scale
         elif method == "ceil":
-            result = np.ceil(arr * 10**decimals) / 10**decimals
+            result = np.ceil(arr * scale) / scale
         elif method == "trunc":
-            result = np.trunc(arr * 10**decimals) / 10**decimals
+            result = np.trunc(arr * scale) / scale
         else:
             raise ValueError(f"Unknown method: {method}")
 
-        final_result = float(result[0]) if is_single else result.tolist()
+        # tolist() yields a float for 0-d arrays and a list otherwise
+        final_result = result.tolist()
 
         return format_result(final_result, {"method": method, "decimals": decimals})
     except Exception as e:
@@ -1,7 +1,7 @@
 """Batch execution tool with auto-discovered tool registry and intelligent orchestration."""
 
 import json
-from typing import Annotated, List, Literal
+from typing import Annotated, Any, Dict, List, Literal, Optional
 from pydantic import Field
 from mcp.types import ToolAnnotations
 
@@ -21,14 +21,24 @@ TOOL_CATEGORIES = {
 }
 
 
+# Wrapped tools are registered at import time and never change afterwards, so the
+# registry is built on the first batch call and reused
+_tool_registry: Optional[Dict[str, Any]] = None
+
+
 async def _build_tool_registry_async():
     """Build registry of wrapped tools from MCP server.
 
     Uses CustomMCP-transformed tools which allows the same transformation layer that individual tool calls use.
+    Built once, then returned from the module-level cache.
 
     Returns:
         Dictionary mapping tool_name -> Tool instance (with wrapper support)
     """
+    global _tool_registry
+    if _tool_registry is not None:
+        return _tool_registry
+
     # Get all tool names from TOOL_CATEGORIES
     tool_names = [tool for tools in TOOL_CATEGORIES.values() for tool in tools]
 
@@ -46,6 +56,7 @@ async def _build_tool_registry_async():
         f"Extra: {actual_tools - expected_tools}"
     )
 
+    _tool_registry = registry
     return registry
 
 
@@ -209,16 +220,10 @@ async def batch_execute(
         # Execute batch
         response: BatchResponse = await executor.execute()
 
-        # Convert to JSON
+        # Convert to compact JSON in one pass with pydantic-core's Rust serialiser,
+        # skipping the intermediate model_dump() dicts
         # Note: CustomMCP will inject batch-level context at top level
-        return json.dumps(
-            {
-                "results": [result.model_dump() for result in response.results],
-                "summary": response.summary.model_dump(),
-            },
-            indent=2,
-            default=str,
-        )
+        return response.model_dump_json(fallback=str)
 
     except Exception as e:
         # Return structured error response
@@ -231,5 +236,5 @@ async def batch_execute(
                 },
                 "results": [],  # No partial results on batch-level error
             },
-            indent=2,
+            separators=(",", ":"),
         )
@@ -3,11 +3,11 @@
 from typing import Annotated, Literal, Union
 from pydantic import Field
 from mcp.types import ToolAnnotations
-from sympy import sympify, diff, integrate, limit, series, Symbol, oo, N, lambdify
+from sympy import diff, integrate, limit, series, Symbol, oo, N
 import scipy.integrate as integrate_numeric
 
 from ..server import mcp
-from ..core import format_result
+from ..core import format_result, numeric_function, parse_expression
 
 
 @mcp.tool(
@@ -64,7 +64,7 @@ async def derivative(
 ) -> str:
     """Compute symbolic derivatives using SymPy. Supports higher orders and partial derivatives. Optional numerical evaluation at a point."""
     try:
-        expr = sympify(expression)
+        expr = parse_expression(expression)
         var = Symbol(variable)
 
         # Compute derivative
@@ -148,7 +148,7 @@ async def integral(
 ) -> str:
     """Compute integrals using SymPy (symbolic/exact) or SciPy (numerical/approximate). Supports indefinite (antiderivatives) and definite (area) integrals."""
     try:
-        expr = sympify(expression)
+        expr = parse_expression(expression)
         var = Symbol(variable)
 
         is_definite = lower_bound is not None and upper_bound is not None
@@ -186,8 +186,8 @@ async def integral(
             if not is_definite:
                 raise ValueError("Numerical integration requires lower_bound and upper_bound")
 
-            # Convert SymPy expression to numeric function
-            func = lambdify(var, expr, "numpy")
+            # Convert SymPy expression to numeric function (compiled once per expression)
+            func = numeric_function(expression, variable)
 
             # Use SciPy's quad for numerical integration
             result, error = integrate_numeric.quad(func, lower_bound, upper_bound)
@@ -278,7 +278,7 @@ async def limits_series(
 ) -> str:
     """Compute limits (lim[x→a]f(x)) and Taylor/Maclaurin series expansions using SymPy. Handles infinity, one-sided limits, removable discontinuities."""
     try:
-        expr = sympify(expression)
+        expr = parse_expression(expression)
         var = Symbol(variable)
 
         # Handle infinity
@@ -2,7 +2,8 @@
 
 import json
 import math
-from typing import Annotated, Any, Dict, List, Literal, Union, cast
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, List, Literal, Mapping, Tuple, Union, cast
 from pydantic import Field
 from mcp.types import ToolAnnotations
 import numpy_financial as npf
@@ -10,6 +11,86 @@ import numpy_financial as npf
 from ..server import mcp
 from ..core import format_result
 
+# Payment timing as numpy-financial encodes it: 0 = end of period, 1 = beginning
+_WHEN = {"end": 0, "begin": 1}
+
+
+# Scalar closed forms of npf.pv/fv/pmt (same formulas and rate == 0 branch). Tool inputs
+# are always scalars, so these skip numpy-financial's array broadcasting overhead.
+def _tvm_factors(rate: float, nper: int, when: int) -> Tuple[float, float]:
+    """Return the compound factor (1 + rate)^nper and the matching annuity factor."""
+    base = 1 + rate
+    try:
+        compound = base**nper
+    except OverflowError:
+        # Float pow raises where npf's array pow overflows to ±inf with a warning; the
+        # inf then propagates through the closed forms exactly as it does in npf
+        compound = -math.inf if base < 0 and nper % 2 else math.inf
+    if rate == 0:
+        return compound, nper
+    return compound, (1 + rate * when) * (compound - 1) / rate
+
+
+def _pv(rate: float, nper: int, pmt: float, fv: float, when: int) -> float:
+    """Present value: -(fv + pmt * annuity factor) / (1 + rate)^nper."""
+    compound, annuity = _tvm_factors(rate, nper, when)
+    return -(fv + pmt * annuity) / compound
+
+
+def _fv(rate: float, nper: int, pmt: float, pv: float, when: int) -> float:
+    """Future value: -(pv * (1 + rate)^nper + pmt * annuity factor)."""
+    compound, annuity = _tvm_factors(rate, nper, when)
+    return -(pv * compound + pmt * annuity)
+
+
+def _pmt(rate: float, nper: int, pv: float, fv: float, when: int) -> float:
+    """Level payment: -(fv + pv * (1 + rate)^nper) / annuity factor."""
+    compound, annuity = _tvm_factors(rate, nper, when)
+    return -(fv + pv * compound) / annuity
+
+
+def _npv(rate: float, cash_flows: List[float]) -> float:
+    """Net present value with the first cash flow at t=0 (same convention as npf.npv)."""
+    # Horner's rule from the last flow back: one multiply-add per value, no temporaries
+    inv = 1.0 / (1.0 + rate)
+    acc = 0.0
+    for cf in reversed(cash_flows):
+        acc = acc * inv + cf
+    return acc
+
+
+def _irr(cash_flows: List[float], guess: float = 0.1, tol: float = 1e-9) -> float:
+    """Internal rate of return by Newton-Raphson, falling back to npf.irr.
+
+    Newton is only trusted for conventional cash flows (a single sign change), where
+    Descartes' rule guarantees one IRR. Otherwise npf.irr's polynomial roots pick the
+    root nearest zero, so behaviour for multi-root streams is unchanged.
+    """
+    signs = [cf > 0 for cf in cash_flows if cf != 0]
+    if sum(a != b for a, b in zip(signs, signs[1:])) == 1:
+        rate = guess
+        for _ in range(100):
+            if rate <= -1.0:
+                break
+            # NPV and its derivative in one pass; discount factors built by multiplication
+            v = 1.0 / (1.0 + rate)
+            disc = 1.0
+            npv = dnpv = 0.0
+            for t, cf in enumerate(cash_flows):
+                npv += cf * disc
+                dnpv -= t * cf * disc
+                disc *= v
+            dnpv *= v
+            if dnpv == 0.0:
+                break
+            step = npv / dnpv
+            rate -= step
+            if abs(step) < tol:
+                if math.isfinite(rate) and rate > -1.0:
+                    return rate
+                break
+    return float(npf.irr(cash_flows))
+
 
 @mcp.tool(
     name="financial_calcs",
@@ -95,6 +176,14 @@ async def financial_calcs(
         if isinstance(cash_flows, str):
             cash_flows = cast(List[float], json.loads(cash_flows))
 
+        # Payment timing as 0/1 so annuity-due adjustments are a multiply, not a branch
+        timing = _WHEN[when]
+
+        # (1 + rate)^periods is zero at rate = -1, so the PV/PMT closed forms divide by
+        # zero and the growing-annuity log1p(rate) is undefined
+        if calculation in ("pv", "fv", "pmt") and rate == -1:
+            raise ValueError(f"{calculation.upper()} calculation requires rate != -1")
+
         if calculation == "pv":
             # Present Value: solve for PV given FV and/or PMT
             if rate is None:
@@ -112,39 +201,35 @@ async def financial_calcs(
                 if growth_rate < 0:
                     raise ValueError("Growth rate cannot be negative")
 
-                # Calculate PV of growing annuity (formula works with positive values)
-                payment_abs = abs(payment)
+                # Calculate PV of a unit growing annuity payment
                 if abs(rate - growth_rate) < 1e-10:
                     # Special case: rate == growth_rate
-                    pv_annuity = payment_abs * periods / (1 + rate)
+                    pv_annuity = periods / (1 + rate)
                 else:
-                    # Standard growing annuity formula
-                    growth_factor = (1 + growth_rate) / (1 + rate)
-                    pv_annuity = payment_abs * (1 - growth_factor**periods) / (rate - growth_rate)
-
-                # Adjust for annuity due
-                if when == "begin":
-                    pv_annuity *= 1 + rate
-
-                # Apply sign: payment < 0 (pay out) → PV > 0 (value received)
-                pv_annuity = pv_annuity if payment < 0 else -pv_annuity
-
-                # Add PV of lump sum if present
-                if future_value is not None and future_value != 0:
-                    pv_lumpsum = abs(future_value) / ((1 + rate) ** periods)
-                    # future_value > 0 (receive) → PV < 0 (cost)
-                    pv_lumpsum = -pv_lumpsum if future_value > 0 else pv_lumpsum
-                    pv_annuity += pv_lumpsum
-
-                result = pv_annuity
+                    # Standard growing annuity formula, with 1 - ((1+g)/(1+r))^n written as
+                    # -expm1(n·(log1p(g) - log1p(r))) so it stays accurate as r approaches g
+                    discount = -math.expm1(periods * (math.log1p(growth_rate) - math.log1p(rate)))
+                    pv_annuity = discount / (rate - growth_rate)
+
+                # Adjust for annuity due (factor is 1 for ordinary annuities)
+                pv_annuity *= 1 + rate * timing
+
+                # Discount any lump sum at maturity (only when one is given, so long
+                # horizons without one never raise 1 + rate to the period count)
+                pv_lumpsum = 0.0
+                if future_value:
+                    pv_lumpsum = future_value / (1 + rate) ** periods
+
+                # Apply sign once: cash paid out (< 0) → PV > 0 (value received), and vice versa
+                result = -(payment * pv_annuity + pv_lumpsum)
             else:
-                # Use numpy-financial for standard (non-growing) calculation
-                result = npf.pv(
+                # Standard (non-growing) calculation
+                result = _pv(
                     rate,
                     periods,
                     float(payment) if payment is not None else 0.0,
-                    float(future_value) if future_value is not None else 0.0,  # type: ignore[arg-type]
-                    when=when,
+                    float(future_value) if future_value is not None else 0.0,
+                    timing,
                 )
 
         elif calculation == "rate":
@@ -179,39 +264,30 @@ async def financial_calcs(
                 if growth_rate < 0:
                     raise ValueError("Growth rate cannot be negative")
 
-                # Calculate FV of growing annuity (formula works with positive values)
-                payment_abs = abs(payment)
+                # Calculate FV of a unit growing annuity payment
+                # Shared by the annuity and lump-sum terms below
+                compound = (1 + rate) ** periods
                 if abs(rate - growth_rate) < 1e-10:
                     # Special case: rate == growth_rate
-                    fv_annuity = payment_abs * periods * ((1 + rate) ** (periods - 1))
+                    fv_annuity = periods * compound / (1 + rate)
                 else:
                     # Standard growing annuity FV formula
-                    fv_annuity = payment_abs * (
-                        ((1 + rate) ** periods - (1 + growth_rate) ** periods)
-                        / (rate - growth_rate)
-                    )
-
-                # Adjust for annuity due
-                if when == "begin":
-                    fv_annuity *= 1 + rate
+                    fv_annuity = (compound - (1 + growth_rate) ** periods) / (rate - growth_rate)
 
-                # Apply sign: payment < 0 (pay) → FV > 0 (accumulate)
-                fv_annuity = fv_annuity if payment < 0 else -fv_annuity
+                # Adjust for annuity due (factor is 1 for ordinary annuities)
+                fv_annuity *= 1 + rate * timing
 
-                # Add FV of present value if present
-                if present_value is not None and present_value != 0:
-                    fv_pv = present_value * ((1 + rate) ** periods)
-                    fv_annuity += fv_pv
-
-                result = fv_annuity
+                # Apply sign once: payment < 0 (pay) → FV > 0 (accumulate); then add FV of
+                # any present value
+                result = -payment * fv_annuity + (present_value or 0.0) * compound
             else:
-                # Use numpy-financial for standard (non-growing) calculation
-                result = npf.fv(
+                # Standard (non-growing) calculation
+                result = _fv(
                     rate,
                     periods,
                     payment,
                     float(present_value) if present_value is not None else 0.0,
-                    when=when,
+                    timing,
                 )
 
         elif calculation == "pmt":
@@ -221,13 +297,12 @@ async def financial_calcs(
             if present_value is None or periods is None:
                 raise ValueError("PMT calculation requires rate, periods, and present_value")
 
-            # Use numpy-financial for battle-tested calculation
-            result = npf.pmt(
+            result = _pmt(
                 rate,
                 periods,
                 present_value,
-                float(future_value) if future_value is not None else 0.0,  # type: ignore[arg-type]
-                when=when,
+                float(future_value) if future_value is not None else 0.0,
+                timing,
             )
 
         elif calculation == "irr":
@@ -235,8 +310,7 @@ async def financial_calcs(
             if cash_flows is None or len(cash_flows) < 2:
                 raise ValueError("IRR calculation requires cash_flows with at least 2 values")
 
-            # Use numpy-financial for battle-tested calculation
-            result = npf.irr(cash_flows)
+            result = _irr(cash_flows)
 
         elif calculation == "npv":
             # Net Present Value
@@ -244,10 +318,11 @@ async def financial_calcs(
                 raise ValueError("NPV calculation requires rate")
             if cash_flows is None:
                 raise ValueError("NPV calculation requires cash_flows and rate")
+            if rate == -1:
+                raise ValueError("NPV calculation requires rate != -1 (discount factor 1/(1+rate))")
 
-            # Use numpy-financial for battle-tested calculation
-            # Note: npf.npv treats first value as t=0 (present), matching our convention
-            result = npf.npv(rate, cash_flows)
+            # First value is t=0 (present), matching numpy-financial's convention
+            result = _npv(rate, cash_flows)
 
         else:
             raise ValueError(f"Unknown calculation type: {calculation}")
@@ -276,6 +351,30 @@ async def financial_calcs(
         raise ValueError(f"Financial calculation failed: {str(e)}")
 
 
+# Compounding periods per year for the discrete frequencies (read-only, built at import)
+_COMPOUNDING_PERIODS: Mapping[str, int] = MappingProxyType(
+    {
+        "annual": 1,
+        "semi-annual": 2,
+        "quarterly": 4,
+        "monthly": 12,
+        "daily": 365,
+    }
+)
+
+
+def _compound_amount(principal: float, rate: float, time: float, n: int | None) -> float:
+    """Final amount after compounding n times a year (None for continuous)."""
+    if n is None:
+        # Continuous compounding: A = Pe^(rt)
+        return principal * math.exp(rate * time)
+    # Discrete compounding: A = P(1 + r/n)^(nt), evaluated as Pe^(nt·log1p(r/n)) so a
+    # small per-period rate (daily) keeps its precision instead of rounding 1 + r/n
+    if rate / n > -1:
+        return principal * math.exp(n * time * math.log1p(rate / n))
+    return principal * (1 + rate / n) ** (n * time)
+
+
 @mcp.tool(
     name="compound_interest",
     description="""Calculate compound interest with various compounding frequencies.
@@ -314,21 +413,7 @@ async def compound_interest(
 ) -> str:
     """Calculate compound interest."""
     try:
-        freq_map = {
-            "annual": 1,
-            "semi-annual": 2,
-            "quarterly": 4,
-            "monthly": 12,
-            "daily": 365,
-        }
-
-        if frequency == "continuous":
-            # Continuous compounding: A = Pe^(rt)
-            final_amount = principal * math.exp(rate * time)
-        else:
-            # Discrete compounding: A = P(1 + r/n)^(nt)
-            n = freq_map[frequency]
-            final_amount = principal * (1 + rate / n) ** (n * time)
+        final_amount = _compound_amount(principal, rate, time, _COMPOUNDING_PERIODS.get(frequency))
 
         interest_earned = final_amount - principal
 
@@ -346,6 +431,20 @@ async def compound_interest(
         raise ValueError(f"Compound interest calculation failed: {str(e)}")
 
 
+def _perpetuity_pv(
+    payment: float, rate: float, growth_rate: float | None, when: str
+) -> Tuple[float, str]:
+    """Present value of a perpetuity and its type label (inputs already validated)."""
+    if growth_rate is not None and growth_rate > 0:
+        # Growing perpetuity: PV = C / (r - g)
+        return payment / (rate - growth_rate), "growing"
+    if when == "begin":
+        # Perpetuity due (payments at beginning): PV = C/r × (1+r)
+        return (payment / rate) * (1 + rate), "level_due"
+    # Ordinary perpetuity (payments at end): PV = C / r
+    return payment / rate, "level_ordinary"
+
+
 @mcp.tool(
     name="perpetuity",
     description="""Calculate present value of a perpetuity (infinite series of payments).
@@ -408,19 +507,7 @@ async def perpetuity(
                     "for perpetuity to have finite value"
                 )
 
-        # Calculate present value based on type
-        if growth_rate is not None and growth_rate > 0:
-            # Growing perpetuity: PV = C / (r - g)
-            pv = payment / (rate - growth_rate)
-            perpetuity_type = "growing"
-        elif when == "begin":
-            # Perpetuity due (payments at beginning): PV = C/r × (1+r)
-            pv = (payment / rate) * (1 + rate)
-            perpetuity_type = "level_due"
-        else:
-            # Ordinary perpetuity (payments at end): PV = C / r
-            pv = payment / rate
-            perpetuity_type = "level_ordinary"
+        pv, perpetuity_type = _perpetuity_pv(payment, rate, growth_rate, when)
 
         # Build metadata
         metadata: Dict[str, Any] = {
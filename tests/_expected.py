@@ -0,0 +1,39 @@
+"""Reference values and tolerances shared by the tool tests."""
+
+import math
+from typing import List, Sequence
+
+# Float comparison tolerances for math.isclose
+REL_TOL = 1e-10
+ABS_TOL = 1e-12  # Needed when the expected value is exactly zero
+
+# Compounding periods per year, written out independently of the implementation
+PERIODS_PER_YEAR = {"annual": 1, "semi-annual": 2, "quarterly": 4, "monthly": 12, "daily": 365}
+
+
+def dot_product(a: Sequence[float], b: Sequence[float]) -> float:
+    """Sum of element-wise products (also the expected sumproduct)."""
+    return float(sum(x * y for x, y in zip(a, b)))
+
+
+def weighted_average(values: Sequence[float], weights: Sequence[float]) -> float:
+    """Weighted mean of values."""
+    return dot_product(values, weights) / sum(weights)
+
+
+def row_means(rows: Sequence[Sequence[float]]) -> List[float]:
+    """Mean of each row (axis=1)."""
+    return [sum(row) / len(row) for row in rows]
+
+
+def column_means(rows: Sequence[Sequence[float]]) -> List[float]:
+    """Mean of each column (axis=0)."""
+    return row_means(list(zip(*rows)))
+
+
+def compound_amount(principal: float, rate: float, time: float, frequency: str) -> float:
+    """Final amount: P(1 + r/n)^(nt), or Pe^(rt) for continuous compounding."""
+    if frequency == "continuous":
+        return principal * math.exp(rate * time)
+    n = PERIODS_PER_YEAR[frequency]
+    return principal * (1 + rate / n) ** (n * time)
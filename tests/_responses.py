@@ -0,0 +1,10 @@
+"""Decoding of MCP tool responses shared by the tool tests."""
+
+from typing import Any
+
+from pydantic_core import from_json
+
+
+def unpack(result: Any) -> Any:
+    """Parse the JSON text of a tool call result (every tool returns one TextContent)."""
+    return from_json(result.content[0].text)
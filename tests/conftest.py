@@ -1,30 +1,69 @@
 """Pytest configuration and shared fixtures."""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 from fastmcp import Client
 from vibe_math_mcp import mcp
 
+from ._responses import unpack
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the session event loop on uvloop when it is installed (non-Windows dev extra).
+
+    Falls back to the default asyncio policy, so the suite runs either way.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def mcp_client():
-    """Create in-memory MCP client for testing."""
+    """Create one in-memory MCP client shared by every test in the session.
+
+    Connected once on the session event loop, so tests skip the per-test
+    connect/handshake. Tests run on the same loop via
+    ``asyncio_default_test_loop_scope`` in pyproject.toml.
+    """
     async with Client(mcp) as client:
         yield client
 
 
 @pytest.fixture
+def call_tools(mcp_client):
+    """Dispatch independent tool calls concurrently and return parsed responses.
+
+    Usage: ``data = await call_tools([("calculate", {"expression": "2+2"}), ...])``
+    """
+
+    async def _call_tools(calls):
+        results = await asyncio.gather(
+            *(mcp_client.call_tool(name, arguments) for name, arguments in calls)
+        )
+        return [unpack(result) for result in results]
+
+    return _call_tools
+
+
+@pytest.fixture(scope="session")
 def sample_array_2x2():
-    """Sample 2×2 array for testing."""
+    """Sample 2×2 array for testing (shared; tests must not mutate it)."""
     return [[1.0, 2.0], [3.0, 4.0]]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_array_3x3():
-    """Sample 3×3 array for testing."""
+    """Sample 3×3 array for testing (shared; tests must not mutate it)."""
     return [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_list():
-    """Sample data list for statistics."""
+    """Sample data list for statistics (shared; tests must not mutate it)."""
     return [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
@@ -1,103 +1,90 @@
 """Tests for basic calculation tools."""
 
-import json
-import pytest
-
-
-@pytest.mark.asyncio
-async def test_calculate_simple(mcp_client):
-    """Test basic arithmetic calculation."""
-    result = await mcp_client.call_tool("calculate", {"expression": "2 + 2"})
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 4.0
-
-
-@pytest.mark.asyncio
-async def test_calculate_with_variables(mcp_client):
-    """Test calculation with variable substitution."""
-    result = await mcp_client.call_tool(
-        "calculate", {"expression": "x^2 + 2*x + 1", "variables": {"x": 3}}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 16.0
-
-
-@pytest.mark.asyncio
-async def test_calculate_trigonometric(mcp_client):
-    """Test trigonometric functions."""
-    result = await mcp_client.call_tool("calculate", {"expression": "sin(pi/2)"})
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - 1.0) < 1e-10
-
-
-@pytest.mark.asyncio
-async def test_percentage_of(mcp_client):
-    """Test percentage 'of' operation."""
-    result = await mcp_client.call_tool(
-        "percentage", {"operation": "of", "value": 200, "percentage": 15}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 30.0
+import math
 
+import numpy.testing as npt
+import pytest
 
-@pytest.mark.asyncio
-async def test_percentage_increase(mcp_client):
-    """Test percentage increase operation."""
-    result = await mcp_client.call_tool(
-        "percentage", {"operation": "increase", "value": 100, "percentage": 20}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 120.0
+from ._expected import ABS_TOL, REL_TOL
+from ._responses import unpack
 
 
 @pytest.mark.asyncio
-async def test_percentage_decrease(mcp_client):
-    """Test percentage decrease operation."""
-    result = await mcp_client.call_tool(
-        "percentage", {"operation": "decrease", "value": 100, "percentage": 20}
+async def test_calculate_expressions(call_tools):
+    """Test arithmetic, variable substitution and trigonometry in one concurrent dispatch."""
+    simple, with_variables, trigonometric = await call_tools(
+        [
+            ("calculate", {"expression": "2 + 2"}),
+            ("calculate", {"expression": "x^2 + 2*x + 1", "variables": {"x": 3}}),
+            ("calculate", {"expression": "sin(pi/2)"}),
+        ]
     )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 80.0
-
 
-@pytest.mark.asyncio
-async def test_round_basic(mcp_client):
-    """Test basic rounding."""
-    result = await mcp_client.call_tool(
-        "round", {"values": 3.14159, "method": "round", "decimals": 2}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 3.14
+    actual = [simple["result"], with_variables["result"], trigonometric["result"]]
+    npt.assert_allclose(actual, [4.0, 16.0, 1.0], rtol=REL_TOL)
 
 
 @pytest.mark.asyncio
-async def test_round_list(mcp_client):
-    """Test rounding a list of values."""
+@pytest.mark.parametrize(
+    "operation,value,percentage,expected",
+    [
+        ("of", 200, 15, 30.0),
+        ("increase", 100, 20, 120.0),
+        ("decrease", 100, 20, 80.0),
+        ("change", 100, 50, -50.0),  # Change from 100 to 50 is -50%
+        ("of", -200, 25, -50.0),  # Negative values
+        ("of", 0, 50, 0.0),  # Percentage of zero
+    ],
+    ids=["of", "increase", "decrease", "change", "negative_value", "zero_value"],
+)
+async def test_percentage(mcp_client, operation, value, percentage, expected):
+    """Test percentage operations."""
     result = await mcp_client.call_tool(
-        "round", {"values": [3.14159, 2.71828], "method": "round", "decimals": 2}
+        "percentage", {"operation": operation, "value": value, "percentage": percentage}
     )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == [3.14, 2.72]
+    data = unpack(result)
+    assert data["result"] == expected
 
 
 @pytest.mark.asyncio
-async def test_convert_degrees_to_radians(mcp_client):
-    """Test degrees to radians conversion."""
+@pytest.mark.parametrize(
+    "values,method,decimals,expected",
+    [
+        (3.14159, "round", 2, 3.14),
+        ([3.14159, 2.71828], "round", 2, [3.14, 2.72]),
+        ([3.14159, 2.71828, 1.41421], "round", 3, [3.142, 2.718, 1.414]),
+        (3.7, "floor", 0, 3.0),
+        (3.1, "ceil", 0, 4.0),
+        (-3.7, "trunc", 0, -3.0),  # Truncate towards zero: -3.7 -> -3
+    ],
+    ids=["basic", "list", "decimals", "floor", "ceil", "trunc"],
+)
+async def test_round(mcp_client, values, method, decimals, expected):
+    """Test rounding methods on single values and lists."""
     result = await mcp_client.call_tool(
-        "convert_units", {"value": 180, "from_unit": "degrees", "to_unit": "radians"}
+        "round", {"values": values, "method": method, "decimals": decimals}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - 3.14159265) < 1e-6
+    data = unpack(result)
+    assert data["result"] == expected
 
 
 @pytest.mark.asyncio
-async def test_convert_radians_to_degrees(mcp_client):
-    """Test radians to degrees conversion."""
+@pytest.mark.parametrize(
+    "value,from_unit,to_unit,expected",
+    [
+        (180, "degrees", "radians", math.pi),
+        (math.pi, "radians", "degrees", 180.0),
+        (0, "degrees", "radians", 0.0),
+    ],
+    ids=["degrees_to_radians", "radians_to_degrees", "zero"],
+)
+async def test_convert_units(mcp_client, value, from_unit, to_unit, expected):
+    """Test angle unit conversion."""
     result = await mcp_client.call_tool(
-        "convert_units", {"value": 3.14159265, "from_unit": "radians", "to_unit": "degrees"}
+        "convert_units", {"value": value, "from_unit": from_unit, "to_unit": to_unit}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - 180.0) < 1e-6
+    data = unpack(result)
+    npt.assert_allclose(data["result"], expected, rtol=REL_TOL, atol=ABS_TOL)
 
 
 @pytest.mark.asyncio
@@ -120,97 +107,14 @@ async def test_calculate_complex_expression(mcp_client):
     result = await mcp_client.call_tool(
         "calculate", {"expression": "sqrt(16) + log(exp(1)) + cos(0)"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # sqrt(16)=4, log(e)=1, cos(0)=1, total=6
-    assert abs(data["result"] - 6.0) < 1e-10
+    assert math.isclose(data["result"], 6.0, rel_tol=REL_TOL)
 
 
 @pytest.mark.asyncio
 async def test_calculate_division_operation(mcp_client):
     """Test division in expression."""
     result = await mcp_client.call_tool("calculate", {"expression": "10 / 2"})
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert data["result"] == 5.0
-
-
-@pytest.mark.asyncio
-async def test_percentage_change(mcp_client):
-    """Test percentage change operation."""
-    result = await mcp_client.call_tool(
-        "percentage", {"operation": "change", "value": 100, "percentage": 50}
-    )
-    data = json.loads(result.content[0].text)
-    # Change from 100 to 50 is -50%
-    assert data["result"] == -50.0
-
-
-@pytest.mark.asyncio
-async def test_percentage_negative_values(mcp_client):
-    """Test percentage operations with negative values."""
-    result = await mcp_client.call_tool(
-        "percentage", {"operation": "of", "value": -200, "percentage": 25}
-    )
-    data = json.loads(result.content[0].text)
-    # 25% of -200 = -50
-    assert data["result"] == -50.0
-
-
-@pytest.mark.asyncio
-async def test_percentage_zero_value(mcp_client):
-    """Test percentage of zero."""
-    result = await mcp_client.call_tool(
-        "percentage", {"operation": "of", "value": 0, "percentage": 50}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 0.0
-
-
-@pytest.mark.asyncio
-async def test_round_floor(mcp_client):
-    """Test floor rounding."""
-    result = await mcp_client.call_tool(
-        "round", {"values": 3.7, "method": "floor", "decimals": 0}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 3.0
-
-
-@pytest.mark.asyncio
-async def test_round_ceil(mcp_client):
-    """Test ceiling rounding."""
-    result = await mcp_client.call_tool(
-        "round", {"values": 3.1, "method": "ceil", "decimals": 0}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 4.0
-
-
-@pytest.mark.asyncio
-async def test_round_trunc(mcp_client):
-    """Test truncation rounding."""
-    result = await mcp_client.call_tool(
-        "round", {"values": -3.7, "method": "trunc", "decimals": 0}
-    )
-    data = json.loads(result.content[0].text)
-    # Truncate towards zero: -3.7 -> -3
-    assert data["result"] == -3.0
-
-
-@pytest.mark.asyncio
-async def test_round_with_decimals(mcp_client):
-    """Test rounding with decimal places."""
-    result = await mcp_client.call_tool(
-        "round", {"values": [3.14159, 2.71828, 1.41421], "method": "round", "decimals": 3}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == [3.142, 2.718, 1.414]
-
-
-@pytest.mark.asyncio
-async def test_convert_units_zero(mcp_client):
-    """Test unit conversion with zero value."""
-    result = await mcp_client.call_tool(
-        "convert_units", {"value": 0, "from_unit": "degrees", "to_unit": "radians"}
-    )
-    data = json.loads(result.content[0].text)
-    assert data["result"] == 0.0
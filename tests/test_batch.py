@@ -1,9 +1,18 @@
 """Comprehensive tests for batch execution functionality."""
 
-import json
+import asyncio
+import math
+import pprint
+from types import SimpleNamespace
+
 import pytest
+from mcp.types import TextContent
+from pydantic import ValidationError
+from vibe_math_mcp.core.batch_executor import BatchExecutor
 from vibe_math_mcp.core.batch_models import BatchOperation, OperationResult
-from vibe_math_mcp.core.result_resolver import ResultResolver
+from vibe_math_mcp.core.result_resolver import CompiledRef, ResultResolver
+
+from ._responses import unpack
 
 
 class TestResultResolver:
@@ -62,6 +71,27 @@ class TestResultResolver:
         })
         assert resolved == {"variables": {"x": 10, "y": 42}}
 
+    def test_reference_free_value_returned_unchanged(self):
+        """Test values without $refs are passed through without copying."""
+        resolver = ResultResolver({"op1": {"result": 10}})
+        arguments = {"expression": "x + 1", "variables": {"x": 2}, "values": [1, 2]}
+
+        assert resolver.resolve(arguments) is arguments
+
+        resolved = resolver.resolve({"x": "$op1.result", "unchanged": arguments})
+        assert resolved == {"x": 10, "unchanged": arguments}
+        assert resolved["unchanged"] is arguments
+
+    def test_shared_subtree_resolved_once(self):
+        """Test a sub-tree referenced from several places is rebuilt only once."""
+        resolver = ResultResolver({"op1": {"result": 10}})
+        shared = {"x": "$op1.result"}
+
+        resolved = resolver.resolve({"a": shared, "b": [shared]})
+        assert resolved == {"a": {"x": 10}, "b": [{"x": 10}]}
+        assert resolved["a"] is resolved["b"][0]
+        assert shared == {"x": "$op1.result"}  # Input left untouched
+
     def test_unknown_operation_error(self):
         """Test error on reference to non-existent operation."""
         results = {"op1": {"result": 42}}
@@ -89,6 +119,20 @@ class TestResultResolver:
         with pytest.raises(ValueError, match="Invalid reference syntax"):
             resolver.resolve("$ op1.result")  # Space in operation ID
 
+    def test_resolver_memoises_across_calls(self):
+        """Test resolved refs are reused across calls while later results stay visible."""
+        results = {"op1": {"result": [1, 2]}}
+        resolver = ResultResolver(results)
+
+        first = resolver.resolve({"a": "$op1.result"})
+        assert resolver.resolve(["$op1.result"])[0] is first["a"]
+
+        # Failed lookups aren't memoised, so results added later still resolve
+        with pytest.raises(ValueError, match="unknown operation"):
+            resolver.resolve("$op2.result")
+        results["op2"] = {"result": 3}
+        assert resolver.resolve("$op2.result") == 3
+
 
 class TestBatchModels:
     """Test Pydantic models for batch operations."""
@@ -115,6 +159,50 @@ class TestBatchModels:
         with pytest.raises(ValueError, match="invalid characters"):
             BatchOperation(id="my calc!", tool="calculate", arguments={})
 
+    def test_batch_operation_is_frozen(self):
+        """Test operations can't be modified after their references are compiled."""
+        op = BatchOperation(id="op1", tool="calculate", arguments={"expression": "2 + 2"})
+
+        with pytest.raises(ValidationError, match="frozen"):
+            op.arguments = {"expression": "$op0.result"}
+
+    def test_batch_operation_compiles_references(self):
+        """Test $refs in arguments are pre-parsed at validation time."""
+        op = BatchOperation(
+            tool="calculate",
+            arguments={"expression": "x + y", "variables": {"x": "$op1.result[0]", "y": "$ bad"}},
+        )
+
+        # Invalid syntax is left for the resolver to report
+        assert op.compiled_refs == {
+            "$op1.result[0]": CompiledRef("$op1.result[0]", "op1", ("result", "0"))
+        }
+
+        resolver = ResultResolver({"op1": {"result": [7]}}, op.compiled_refs)
+        assert resolver.resolve(op.arguments["variables"]["x"]) == 7
+
+        # Dependencies cover every $ string so bad refs surface as missing operations
+        assert op.dependencies == {"op1", " bad"}
+
+        # Sites record where each $ string sits, so resolution can skip the tree walk
+        assert op.ref_sites == (
+            (("variables", "x"), "$op1.result[0]"),
+            (("variables", "y"), "$ bad"),
+        )
+
+    def test_resolve_sites_matches_full_resolution(self):
+        """Test resolving at recorded ref sites gives the same result as a full walk."""
+        op = BatchOperation(
+            tool="calculate",
+            arguments={"expression": "x + y", "variables": {"x": "$op1.result", "y": 2}},
+        )
+        resolver = ResultResolver({"op1": {"result": 10}}, op.compiled_refs)
+
+        resolved = resolver.resolve_sites(op.arguments, op.ref_sites)
+        assert resolved == resolver.resolve(op.arguments)
+        assert resolved == {"expression": "x + y", "variables": {"x": 10, "y": 2}}
+        assert op.arguments["variables"]["x"] == "$op1.result"  # Input left untouched
+
     def test_operation_result_success(self):
         """Test OperationResult for successful operation."""
         result = OperationResult(
@@ -147,6 +235,28 @@ class TestBatchModels:
         assert result.error["type"] == "ValueError"
 
 
+class DelayedTool:
+    """Stand-in tool that sleeps for arguments["delay"] seconds and logs start/end."""
+
+    def __init__(self):
+        self.log = []
+
+    async def run(self, arguments):
+        self.log.append(("start", arguments["name"]))
+        await asyncio.sleep(arguments["delay"])
+        self.log.append(("end", arguments["name"]))
+        if arguments.get("fail"):
+            raise ValueError(f"{arguments['name']} failed")
+        return SimpleNamespace(content=[TextContent(type="text", text='{"result": 1}')])
+
+
+def delayed_op(name, delay, **arguments):
+    """BatchOperation for DelayedTool (extra arguments may hold $refs or fail=True)."""
+    return BatchOperation(
+        id=name, tool="delayed", arguments={"name": name, "delay": delay, **arguments}
+    )
+
+
 @pytest.mark.asyncio
 class TestBatchExecutor:
     """Test the batch executor with DAG-based parallelization."""
@@ -168,7 +278,7 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         assert len(data["results"]) == 2
         assert data["results"][0]["id"] == "op1"
@@ -191,7 +301,7 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         assert len(data["results"]) == 3
         assert data["summary"]["num_waves"] == 1
@@ -220,7 +330,7 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         assert len(data["results"]) == 3
         assert data["summary"]["num_waves"] == 2
@@ -254,7 +364,7 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Should return error response
         assert "error" in data
@@ -279,7 +389,7 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Should return error response
         assert "error" in data
@@ -309,13 +419,80 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Only op1 should have executed (and failed)
         assert len(data["results"]) == 1
         assert data["results"][0]["status"] == "error"
         assert data["summary"]["failed"] == 1
 
+    async def test_stop_on_error_true_auto_mode(self, mcp_client):
+        """Test auto mode finishes the failing wave, then runs no later wave."""
+        result = await mcp_client.call_tool(
+            "batch_execute",
+            {
+                "operations": [
+                    {
+                        "id": "op1",
+                        "tool": "calculate",
+                        "arguments": {"expression": "undefined_variable"},
+                    },
+                    {"id": "op2", "tool": "calculate", "arguments": {"expression": "2 + 2"}},
+                    {
+                        "id": "op3",
+                        "tool": "calculate",
+                        "arguments": {"expression": "x * 2", "variables": {"x": "$op2.result"}},
+                    },
+                ],
+                "execution_mode": "auto",
+                "stop_on_error": True,
+            },
+        )
+
+        data = unpack(result)
+
+        # Wave 0 (op1, op2) ran in full; op3 in wave 1 never started
+        assert [r["id"] for r in data["results"]] == ["op1", "op2"]
+        assert [r["status"] for r in data["results"]] == ["error", "success"]
+        # num_waves counts only the waves completed before the failing one
+        assert data["summary"]["num_waves"] == 0
+
+    async def test_auto_mode_starts_dependents_early(self):
+        """Test an operation starts once its own dependencies finish, not its whole wave."""
+        tool = DelayedTool()
+        ops = [
+            delayed_op("fast", 0.01),
+            delayed_op("slow", 0.3),
+            delayed_op("after_fast", 0, after="$fast.result"),
+        ]
+
+        response = await BatchExecutor(ops, {"delayed": tool}, mode="auto").execute()
+
+        # after_fast (wave 1) completed while slow (wave 0) was still running
+        assert tool.log.index(("end", "after_fast")) < tool.log.index(("end", "slow"))
+        assert [r.id for r in response.results] == ["fast", "slow", "after_fast"]
+        assert [r.wave for r in response.results] == [0, 0, 1]
+        assert response.summary.num_waves == 2
+
+    async def test_auto_mode_stop_on_error_waits_for_wave(self):
+        """Test stop_on_error starts nothing from a later wave before the current one ends."""
+        tool = DelayedTool()
+        ops = [
+            delayed_op("slow_failure", 0.2, fail=True),
+            delayed_op("fast", 0.01),
+            delayed_op("after_fast", 0, after="$fast.result"),
+        ]
+
+        response = await BatchExecutor(
+            ops, {"delayed": tool}, mode="auto", stop_on_error=True
+        ).execute()
+
+        # Early dispatch would have started after_fast before slow_failure failed
+        assert ("start", "after_fast") not in tool.log
+        assert [r.id for r in response.results] == ["slow_failure", "fast"]
+        assert response.summary.failed == 1
+        assert response.summary.num_waves == 0
+
     async def test_stop_on_error_false(self, mcp_client):
         """Test that execution continues on error when stop_on_error=False."""
         result = await mcp_client.call_tool(
@@ -340,7 +517,7 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Both operations should have executed
         assert len(data["results"]) == 2
@@ -378,7 +555,7 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Context should be in result
         assert data["results"][0]["result"]
@@ -401,11 +578,42 @@ class TestBatchExecutor:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Label should pass through
         assert data["results"][0]["label"] == "Calculate bond PV"
 
+    async def test_identical_operations_memoized(self, mcp_client):
+        """Test that repeated identical calls reuse results without leaking context."""
+        result = await mcp_client.call_tool(
+            "batch_execute",
+            {
+                "operations": [
+                    {
+                        "id": "op1",
+                        "tool": "calculate",
+                        "arguments": {"expression": "2 + 2"},
+                        "context": "First",
+                    },
+                    {
+                        "id": "op2",
+                        "tool": "calculate",
+                        "arguments": {"expression": "2 + 2"},
+                        "context": "Second",
+                    },
+                ],
+                "execution_mode": "sequential",
+            },
+        )
+
+        data = unpack(result)
+
+        assert data["summary"]["succeeded"] == 2
+        assert data["results"][0]["result"]["result"] == 4.0
+        assert data["results"][1]["result"]["result"] == 4.0
+        assert data["results"][0]["result"]["context"] == "First"
+        assert data["results"][1]["result"]["context"] == "Second"
+
 
 @pytest.mark.asyncio
 class TestBatchIntegration:
@@ -427,11 +635,10 @@ class TestBatchIntegration:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Debug: print full data if failed
         if data.get("summary", {}).get("failed", 0) > 0:
-            import pprint
             print("\n=== BATCH RESPONSE ===")
             pprint.pprint(data)
             print("======================\n")
@@ -461,12 +668,49 @@ class TestBatchIntegration:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         assert data["results"][0]["result"]["result"] == 15
         assert data["results"][1]["result"]["result"] == 30  # 15 * 2
         assert data["summary"]["num_waves"] == 2
 
+    async def test_batch_chains_financial_steps(self, mcp_client):
+        """Test a two-step TVM chain (deferred annuity) in a single batch call."""
+        result = await mcp_client.call_tool(
+            "batch_execute",
+            {
+                "operations": [
+                    {
+                        "id": "at_start",
+                        "tool": "financial_calcs",
+                        "arguments": {
+                            "calculation": "pv",
+                            "rate": 0.08,
+                            "periods": 4,
+                            "payment": -20000,
+                        },
+                    },
+                    {
+                        "id": "today",
+                        "tool": "financial_calcs",
+                        "arguments": {
+                            "calculation": "pv",
+                            "rate": 0.08,
+                            "periods": 3,
+                            "future_value": "$at_start.result",
+                        },
+                    },
+                ]
+            },
+        )
+
+        data = unpack(result)
+
+        assert math.isclose(data["results"][0]["result"]["result"], 66242.54, abs_tol=0.01)
+        # Receiving the annuity's value at year 3 costs its discounted value today
+        assert math.isclose(data["results"][1]["result"]["result"], -52585.46, abs_tol=0.01)
+        assert data["summary"]["num_waves"] == 2
+
     async def test_batch_execute_invalid_tool(self, mcp_client):
         """Test error handling for invalid tool name."""
         result = await mcp_client.call_tool(
@@ -474,7 +718,7 @@ class TestBatchIntegration:
             {"operations": [{"id": "bad", "tool": "nonexistent", "arguments": {}}]},
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         assert "error" in data
         assert "nonexistent" in data["error"]["message"]
@@ -495,7 +739,7 @@ class TestBatchIntegration:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # In value mode, should get flat mapping
         assert "svd" in data
@@ -527,7 +771,7 @@ class TestBatchIntegration:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Derivative of x^2 is 2x, at x=3 is 6
         # Then 6 * 10 = 60
@@ -573,7 +817,7 @@ class TestBatchIntegration:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # In minimal mode, should have simplified structure
         assert "results" in data
@@ -617,7 +861,7 @@ class TestBatchIntegration:
             },
         )
 
-        data = json.loads(result.content[0].text)
+        data = unpack(result)
 
         # Final mode should return only terminal result for sequential chain
         # calc1: 20, calc2: 25, final_calc: 75
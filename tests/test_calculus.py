@@ -1,8 +1,9 @@
 """Tests for calculus tools."""
 
-import json
 import pytest
 
+from ._responses import unpack
+
 
 @pytest.mark.asyncio
 async def test_derivative_basic(mcp_client):
@@ -10,7 +11,7 @@ async def test_derivative_basic(mcp_client):
     result = await mcp_client.call_tool(
         "derivative", {"expression": "x^2", "variable": "x", "order": 1}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "2*x" in data["result"] or "2x" in data["result"]
 
@@ -21,7 +22,7 @@ async def test_derivative_second_order(mcp_client):
     result = await mcp_client.call_tool(
         "derivative", {"expression": "x^3", "variable": "x", "order": 2}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "6*x" in data["result"] or "6x" in data["result"]
 
@@ -32,7 +33,7 @@ async def test_derivative_at_point(mcp_client):
     result = await mcp_client.call_tool(
         "derivative", {"expression": "x^2", "variable": "x", "order": 1, "point": 3}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # d/dx(x^2) = 2x, at x=3 → 6
     assert data["value_at_point"] == 6.0
 
@@ -43,7 +44,7 @@ async def test_integral_indefinite(mcp_client):
     result = await mcp_client.call_tool(
         "integral", {"expression": "x^2", "variable": "x", "method": "symbolic"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "x**3/3" in data["result"] or "x^3/3" in data["result"]
 
@@ -61,7 +62,7 @@ async def test_integral_definite(mcp_client):
             "method": "symbolic",
         },
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # ∫₀¹ x² dx = 1/3
     assert abs(data["result"] - (1 / 3)) < 1e-10
@@ -80,7 +81,7 @@ async def test_integral_numerical(mcp_client):
             "method": "numerical",
         },
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # ∫₀^π sin(x) dx ≈ 2
     assert abs(data["result"] - 2.0) < 0.01
@@ -93,7 +94,7 @@ async def test_limit_basic(mcp_client):
         "limits_series",
         {"expression": "sin(x)/x", "variable": "x", "point": 0, "operation": "limit"},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # lim(x→0) sin(x)/x = 1
     assert data["numeric_value"] == 1.0
 
@@ -105,7 +106,7 @@ async def test_limit_infinity(mcp_client):
         "limits_series",
         {"expression": "1/x", "variable": "x", "point": "oo", "operation": "limit"},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # lim(x→∞) 1/x = 0
     assert data["numeric_value"] == 0.0
 
@@ -117,7 +118,7 @@ async def test_series_expansion(mcp_client):
         "limits_series",
         {"expression": "exp(x)", "variable": "x", "point": 0, "operation": "series", "order": 4},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Taylor series of e^x around 0 - result contains the series string
     assert "result" in data
     # Series should contain basic expansion terms
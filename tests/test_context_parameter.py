@@ -1,160 +1,62 @@
 """Tests for context parameter pass-through across all tool modules."""
 
-import json
 import pytest
 
+from ._responses import unpack
 
-@pytest.mark.asyncio
-async def test_basic_context_included(mcp_client):
-    """Test that context is included in response when provided - basic.py."""
-    result = await mcp_client.call_tool(
-        "calculate",
-        {"expression": "2 + 2", "context": "test context for calculation"},
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" in data
-    assert data["context"] == "test context for calculation"
-
-
-@pytest.mark.asyncio
-async def test_basic_context_excluded(mcp_client):
-    """Test that context key is NOT in response when omitted - basic.py."""
-    result = await mcp_client.call_tool("calculate", {"expression": "2 + 2"})
-    data = json.loads(result.content[0].text)
-    assert "context" not in data
-
-
-@pytest.mark.asyncio
-async def test_array_context_included(mcp_client):
-    """Test that context is included in response when provided - array.py."""
-    result = await mcp_client.call_tool(
-        "array_operations",
-        {
-            "operation": "multiply",
-            "array1": [[1, 2], [3, 4]],
-            "array2": 2,
-            "context": "scaling matrix by 2",
-        },
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" in data
-    assert data["context"] == "scaling matrix by 2"
-
-
-@pytest.mark.asyncio
-async def test_array_context_excluded(mcp_client):
-    """Test that context key is NOT in response when omitted - array.py."""
-    result = await mcp_client.call_tool(
+# One representative tool per module: (tool, arguments, context string)
+CONTEXT_CASES = [
+    pytest.param(
+        "calculate", {"expression": "2 + 2"}, "test context for calculation", id="basic"
+    ),
+    pytest.param(
         "array_operations",
         {"operation": "multiply", "array1": [[1, 2], [3, 4]], "array2": 2},
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" not in data
-
-
-@pytest.mark.asyncio
-async def test_statistics_context_included(mcp_client):
-    """Test that context is included in response when provided - statistics.py."""
-    result = await mcp_client.call_tool(
+        "scaling matrix by 2",
+        id="array",
+    ),
+    pytest.param(
         "statistics",
-        {
-            "data": [1, 2, 3, 4, 5],
-            "analyses": ["describe"],
-            "context": "analyzing sample data",
-        },
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" in data
-    assert data["context"] == "analyzing sample data"
-
-
-@pytest.mark.asyncio
-async def test_statistics_context_excluded(mcp_client):
-    """Test that context key is NOT in response when omitted - statistics.py."""
-    result = await mcp_client.call_tool(
-        "statistics", {"data": [1, 2, 3, 4, 5], "analyses": ["describe"]}
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" not in data
-
-
-@pytest.mark.asyncio
-async def test_financial_context_included(mcp_client):
-    """Test that context is included in response when provided - financial.py."""
-    result = await mcp_client.call_tool(
-        "financial_calcs",
-        {
-            "calculation": "pv",
-            "rate": 0.05,
-            "periods": 10,
-            "future_value": 1000,
-            "context": "calculating bond present value",
-        },
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" in data
-    assert data["context"] == "calculating bond present value"
-
-
-@pytest.mark.asyncio
-async def test_financial_context_excluded(mcp_client):
-    """Test that context key is NOT in response when omitted - financial.py."""
-    result = await mcp_client.call_tool(
+        {"data": [1, 2, 3, 4, 5], "analyses": ["describe"]},
+        "analyzing sample data",
+        id="statistics",
+    ),
+    pytest.param(
         "financial_calcs",
         {"calculation": "pv", "rate": 0.05, "periods": 10, "future_value": 1000},
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" not in data
-
-
-@pytest.mark.asyncio
-async def test_linalg_context_included(mcp_client):
-    """Test that context is included in response when provided - linalg.py."""
-    result = await mcp_client.call_tool(
+        "calculating bond present value",
+        id="financial",
+    ),
+    pytest.param(
         "matrix_operations",
-        {
-            "operation": "determinant",
-            "matrix1": [[1, 2], [3, 4]],
-            "context": "checking matrix invertibility",
-        },
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" in data
-    assert data["context"] == "checking matrix invertibility"
-
-
-@pytest.mark.asyncio
-async def test_linalg_context_excluded(mcp_client):
-    """Test that context key is NOT in response when omitted - linalg.py."""
-    result = await mcp_client.call_tool(
-        "matrix_operations", {"operation": "determinant", "matrix1": [[1, 2], [3, 4]]}
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" not in data
+        {"operation": "determinant", "matrix1": [[1, 2], [3, 4]]},
+        "checking matrix invertibility",
+        id="linalg",
+    ),
+    pytest.param(
+        "derivative",
+        {"expression": "x^2", "variable": "x", "order": 1},
+        "finding velocity from position",
+        id="calculus",
+    ),
+]
 
 
 @pytest.mark.asyncio
-async def test_calculus_context_included(mcp_client):
-    """Test that context is included in response when provided - calculus.py."""
-    result = await mcp_client.call_tool(
-        "derivative",
-        {
-            "expression": "x^2",
-            "variable": "x",
-            "order": 1,
-            "context": "finding velocity from position",
-        },
-    )
-    data = json.loads(result.content[0].text)
+@pytest.mark.parametrize("tool,arguments,context", CONTEXT_CASES)
+async def test_context_included(mcp_client, tool, arguments, context):
+    """Test that context is included in response when provided."""
+    # Merge into a new dict: the case table is shared across tests and must not change
+    result = await mcp_client.call_tool(tool, arguments | {"context": context})
+    data = unpack(result)
     assert "context" in data
-    assert data["context"] == "finding velocity from position"
+    assert data["context"] == context
 
 
 @pytest.mark.asyncio
-async def test_calculus_context_excluded(mcp_client):
-    """Test that context key is NOT in response when omitted - calculus.py."""
-    result = await mcp_client.call_tool(
-        "derivative", {"expression": "x^2", "variable": "x", "order": 1}
-    )
-    data = json.loads(result.content[0].text)
-    assert "context" not in data
+@pytest.mark.parametrize("tool,arguments,context", CONTEXT_CASES)
+async def test_context_excluded(mcp_client, tool, arguments, context):
+    """Test that context key is NOT in response when omitted."""
+    result = await mcp_client.call_tool(tool, arguments)
+    # Key absence needs no parse (test_context_included checks the JSON shape)
+    assert '"context":' not in result.content[0].text
@@ -1,8 +1,30 @@
 """Tests for financial mathematics tools."""
 
-import json
+import math
+
 import pytest
 
+from ._expected import compound_amount
+from ._responses import unpack
+
+# Expected values from the closed-form formulas, computed once at import
+# FV of annuity: PMT * ((1+r)^n - 1) / r
+FV_ANNUITY_100_5PCT_10Y = 100 * ((1.05**10 - 1) / 0.05)
+# PV of lump sum: FV / (1+r)^n
+PV_LUMP_SUM_10000_5PCT_10Y = 10000 / 1.05**10  # 6139.13
+# Coupon bond: PV(face value) + PV(coupons)
+PV_FACE_VALUE_1000_5PCT_10Y = 1000 / 1.05**10  # 613.91
+PV_COUPONS_30_5PCT_10Y = 30 * ((1 - 1.05**-10) / 0.05)  # 231.65
+# compound_interest inputs: (principal, rate, time, frequency)
+COMPOUND_CASES = [
+    (1000, 0.05, 10, "annual"),
+    (1000, 0.05, 10, "continuous"),
+    (1000, 0.06, 5, "semi-annual"),
+    (1000, 0.08, 3, "quarterly"),
+    (5000, 0.05, 2, "monthly"),
+    (2000, 0.04, 1, "daily"),
+]
+
 
 @pytest.mark.asyncio
 async def test_financial_fv(mcp_client):
@@ -10,10 +32,8 @@ async def test_financial_fv(mcp_client):
     result = await mcp_client.call_tool(
         "financial_calcs", {"calculation": "fv", "rate": 0.05, "periods": 10, "payment": -100}
     )
-    data = json.loads(result.content[0].text)
-    # FV of annuity: PMT * ((1+r)^n - 1) / r
-    expected = 100 * (((1.05) ** 10 - 1) / 0.05)
-    assert abs(data["result"] - expected) < 1
+    data = unpack(result)
+    assert math.isclose(data["result"], FV_ANNUITY_100_5PCT_10Y, abs_tol=1)
 
 
 @pytest.mark.asyncio
@@ -22,7 +42,7 @@ async def test_financial_pv(mcp_client):
     result = await mcp_client.call_tool(
         "financial_calcs", {"calculation": "pv", "rate": 0.05, "periods": 10, "payment": -100}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # PV calculation returns negative value representing outflow
     assert "result" in data
 
@@ -36,9 +56,9 @@ async def test_financial_pv_lump_sum(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.05, "periods": 10, "future_value": 10000}
     )
-    data = json.loads(result.content[0].text)
-    expected = 10000 / (1.05 ** 10)  # 6139.13
-    assert abs(data["result"] - (-expected)) < 0.01  # Negative because it's cash outflow
+    data = unpack(result)
+    # Negative because it's cash outflow
+    assert math.isclose(data["result"], -PV_LUMP_SUM_10000_5PCT_10Y, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -49,8 +69,8 @@ async def test_financial_pv_lump_sum_zero_rate(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.0, "periods": 10, "future_value": 10000}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - (-10000.0)) < 0.01
+    data = unpack(result)
+    assert math.isclose(data["result"], -10000.0, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -76,13 +96,9 @@ async def test_financial_pv_coupon_bond(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.05, "periods": 10, "payment": 30, "future_value": 1000}
     )
-    data = json.loads(result.content[0].text)
-    # PV of lump sum component
-    pv_face_value = 1000 / (1.05 ** 10)  # 613.91
-    # PV of annuity component
-    pv_coupons = 30 * ((1 - (1.05 ** -10)) / 0.05)  # 231.65
-    expected = -(pv_face_value + pv_coupons)  # -845.56 (negative = outflow)
-    assert abs(data["result"] - expected) < 0.01
+    data = unpack(result)
+    expected = -(PV_FACE_VALUE_1000_5PCT_10Y + PV_COUPONS_30_5PCT_10Y)  # -845.56 (outflow)
+    assert math.isclose(data["result"], expected, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -92,37 +108,26 @@ async def test_financial_npv(mcp_client):
     result = await mcp_client.call_tool(
         "financial_calcs", {"calculation": "npv", "rate": 0.1, "cash_flows": cash_flows}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
 
 
 @pytest.mark.asyncio
-async def test_compound_interest_annual(mcp_client):
-    """Test compound interest with annual compounding."""
+@pytest.mark.parametrize(
+    "principal,rate,time,frequency",
+    COMPOUND_CASES,
+    ids=[case[3] for case in COMPOUND_CASES],
+)
+async def test_compound_interest(mcp_client, principal, rate, time, frequency):
+    """Test compound interest for each compounding frequency."""
     result = await mcp_client.call_tool(
         "compound_interest",
-        {"principal": 1000, "rate": 0.05, "time": 10, "frequency": "annual"},
+        {"principal": principal, "rate": rate, "time": time, "frequency": frequency},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
-    expected = 1000 * (1.05**10)
-    assert abs(data["result"] - expected) < 0.01
-
-
-@pytest.mark.asyncio
-async def test_compound_interest_continuous(mcp_client):
-    """Test compound interest with continuous compounding."""
-    result = await mcp_client.call_tool(
-        "compound_interest",
-        {"principal": 1000, "rate": 0.05, "time": 10, "frequency": "continuous"},
-    )
-    data = json.loads(result.content[0].text)
-    assert "result" in data
-    # Continuous: A = Pe^(rt)
-    import math
-
-    expected = 1000 * math.exp(0.05 * 10)
-    assert abs(data["result"] - expected) < 0.01
+    expected = compound_amount(principal, rate, time, frequency)
+    assert math.isclose(data["result"], expected, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -133,7 +138,7 @@ async def test_financial_pmt_basic(mcp_client):
         "financial_calcs",
         {"calculation": "pmt", "rate": 0.05, "periods": 12, "present_value": -10000},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # PMT should be positive (payment outflow)
     assert data["result"] > 0
     # Expected PMT ≈ 1128.25
@@ -148,9 +153,9 @@ async def test_financial_pmt_zero_rate(mcp_client):
         "financial_calcs",
         {"calculation": "pmt", "rate": 0.0, "periods": 10, "present_value": -1000},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # PMT = 1000 / 10 = 100
-    assert abs(data["result"] - 100.0) < 0.01
+    assert math.isclose(data["result"], 100.0, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -161,46 +166,30 @@ async def test_financial_pmt_missing_params(mcp_client):
     assert "requires" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_financial_irr_simple_investment(mcp_client):
-    """Test IRR for a simple investment."""
+# (cash flows, expected IRR to 4dp); each vector is solved once
+IRR_CASES = [
     # Initial investment of -$1000, returns of $500, $400, $300, $200
-    cash_flows = [-1000, 500, 400, 300, 200]
-    result = await mcp_client.call_tool(
-        "financial_calcs", {"calculation": "irr", "rate": 0.1, "cash_flows": cash_flows}
-    )
-    data = json.loads(result.content[0].text)
-    # IRR should be positive for profitable investment
-    assert data["result"] > 0
-    # Expected IRR approximately 0.149 (14.9%)
-    assert 0.12 < data["result"] < 0.18
-
-
-@pytest.mark.asyncio
-async def test_financial_irr_complex_cash_flows(mcp_client):
-    """Test IRR with more complex cash flow pattern."""
+    pytest.param([-1000, 500, 400, 300, 200], 0.1780, id="simple_investment"),
     # Project with initial investment and varying returns
-    cash_flows = [-5000, 1000, 1500, 2000, 2500, 1000]
-    result = await mcp_client.call_tool(
-        "financial_calcs", {"calculation": "irr", "rate": 0.1, "cash_flows": cash_flows}
-    )
-    data = json.loads(result.content[0].text)
-    # IRR should be positive
-    assert data["result"] > 0
-    assert data["result"] < 1.0  # Should be reasonable (< 100%)
+    pytest.param([-5000, 1000, 1500, 2000, 2500, 1000], 0.1691, id="complex_cash_flows"),
+    # Investment that loses money: IRR is negative
+    pytest.param([-1000, 100, 150, 200, 100], -0.2017, id="negative_return"),
+    # Level returns of $3,000 for 5 years on $10,000 (15.24%, from audit)
+    pytest.param([-10000, 3000, 3000, 3000, 3000, 3000], 0.1524, id="level_returns"),
+    # Two sign changes: IRRs of 10% and 20%, the one nearest zero is reported
+    pytest.param([-100, 230, -132], 0.1000, id="multiple_roots"),
+]
 
 
 @pytest.mark.asyncio
-async def test_financial_irr_negative_return(mcp_client):
-    """Test IRR for a losing investment."""
-    # Investment that loses money
-    cash_flows = [-1000, 100, 150, 200, 100]
+@pytest.mark.parametrize("cash_flows,expected", IRR_CASES)
+async def test_financial_irr(mcp_client, cash_flows, expected):
+    """Test IRR against the rate at which NPV is zero."""
     result = await mcp_client.call_tool(
         "financial_calcs", {"calculation": "irr", "rate": 0.1, "cash_flows": cash_flows}
     )
-    data = json.loads(result.content[0].text)
-    # IRR should be negative for unprofitable investment
-    assert data["result"] < 0
+    data = unpack(result)
+    assert math.isclose(data["result"], expected, abs_tol=0.0001)
 
 
 @pytest.mark.asyncio
@@ -213,20 +202,6 @@ async def test_financial_irr_insufficient_cash_flows(mcp_client):
     assert "at least 2" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_financial_irr_convergence(mcp_client):
-    """Test IRR convergence with standard cash flows."""
-    # Well-behaved cash flows that should converge quickly
-    # Initial investment of $10,000, returns of $3,000 for 5 years
-    cash_flows = [-10000, 3000, 3000, 3000, 3000, 3000]
-    result = await mcp_client.call_tool(
-        "financial_calcs", {"calculation": "irr", "rate": 0.1, "cash_flows": cash_flows}
-    )
-    data = json.loads(result.content[0].text)
-    # Expected IRR: 15.24% (from audit and verified calculation)
-    assert abs(data["result"] - 0.1524) < 0.0001
-
-
 @pytest.mark.asyncio
 async def test_financial_fv_zero_rate(mcp_client):
     """Test future value calculation with zero interest rate."""
@@ -234,9 +209,9 @@ async def test_financial_fv_zero_rate(mcp_client):
     result = await mcp_client.call_tool(
         "financial_calcs", {"calculation": "fv", "rate": 0.0, "periods": 10, "payment": -100}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # FV = 100 × 10 = 1000
-    assert abs(data["result"] - 1000.0) < 0.01
+    assert math.isclose(data["result"], 1000.0, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -246,81 +221,105 @@ async def test_financial_pv_zero_rate(mcp_client):
     result = await mcp_client.call_tool(
         "financial_calcs", {"calculation": "pv", "rate": 0.0, "periods": 10, "payment": -100}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # PV = 100 × 10 = 1000
-    assert abs(data["result"] - 1000.0) < 0.01
+    assert math.isclose(data["result"], 1000.0, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
-async def test_financial_npv_missing_cash_flows(mcp_client):
-    """Test error when NPV is calculated without cash flows."""
-    with pytest.raises(Exception) as exc_info:
-        await mcp_client.call_tool("financial_calcs", {"calculation": "npv", "rate": 0.1})
-    assert "requires" in str(exc_info.value).lower() or "cash_flows" in str(exc_info.value).lower()
+async def test_financial_fv_large_periods(mcp_client):
+    """Test that (1 + rate)^periods overflowing gives infinity, not an error."""
+    result = await mcp_client.call_tool(
+        "financial_calcs",
+        {
+            "calculation": "fv",
+            "rate": 0.5,
+            "periods": 2000,
+            "payment": -1,
+            "present_value": -100,
+        },
+    )
+    data = unpack(result)
+    # 1.5^2000 overflows a float; numpy-financial returns +inf here too
+    assert math.isinf(data["result"]) and data["result"] > 0
 
 
 @pytest.mark.asyncio
-async def test_compound_interest_semi_annual(mcp_client):
-    """Test compound interest with semi-annual compounding."""
+async def test_financial_pv_large_periods(mcp_client):
+    """Test that an overflowing discount factor matches numpy-financial instead of failing."""
     result = await mcp_client.call_tool(
-        "compound_interest",
-        {"principal": 1000, "rate": 0.06, "time": 5, "frequency": "semi-annual"},
+        "financial_calcs",
+        {"calculation": "pv", "rate": 0.5, "periods": 2000, "future_value": 1000},
     )
-    data = json.loads(result.content[0].text)
-    assert "result" in data
-    # Semi-annual: n=2, A = 1000 * (1 + 0.06/2)^(2*5)
-    expected = 1000 * (1 + 0.06 / 2) ** (2 * 5)
-    assert abs(data["result"] - expected) < 0.01
+    data = unpack(result)
+    # npf.pv evaluates 0 × inf / inf here, which is NaN
+    assert math.isnan(data["result"])
 
 
 @pytest.mark.asyncio
-async def test_compound_interest_quarterly(mcp_client):
-    """Test compound interest with quarterly compounding."""
+async def test_financial_pv_growing_annuity_large_periods(mcp_client):
+    """Test growing-annuity PV over a long horizon with no lump sum at maturity."""
     result = await mcp_client.call_tool(
-        "compound_interest",
-        {"principal": 1000, "rate": 0.08, "time": 3, "frequency": "quarterly"},
+        "financial_calcs",
+        {
+            "calculation": "pv",
+            "rate": 0.5,
+            "periods": 2000,
+            "payment": -100,
+            "growth_rate": 0.03,
+        },
     )
-    data = json.loads(result.content[0].text)
-    assert "result" in data
-    # Quarterly: n=4, A = 1000 * (1 + 0.08/4)^(4*3)
-    expected = 1000 * (1 + 0.08 / 4) ** (4 * 3)
-    assert abs(data["result"] - expected) < 0.01
+    data = unpack(result)
+    # ((1+g)/(1+r))^n vanishes, leaving the growing perpetuity C/(r-g) = 100/0.47
+    assert math.isclose(data["result"], 212.77, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
-async def test_compound_interest_monthly(mcp_client):
-    """Test compound interest with monthly compounding."""
-    result = await mcp_client.call_tool(
-        "compound_interest",
-        {"principal": 5000, "rate": 0.05, "time": 2, "frequency": "monthly"},
-    )
-    data = json.loads(result.content[0].text)
-    assert "result" in data
-    # Monthly: n=12, A = 5000 * (1 + 0.05/12)^(12*2)
-    expected = 5000 * (1 + 0.05 / 12) ** (12 * 2)
-    assert abs(data["result"] - expected) < 0.01
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"calculation": "pv", "periods": 10, "future_value": 1000},
+        {"calculation": "fv", "periods": 10, "payment": -100},
+        {"calculation": "pmt", "periods": 10, "present_value": -1000, "when": "begin"},
+        {"calculation": "pv", "periods": 10, "payment": -100, "growth_rate": 0.03},
+    ],
+)
+async def test_financial_tvm_rate_minus_one(mcp_client, arguments):
+    """Test error when PV/FV/PMT use a -100% rate, where (1 + rate)^periods is zero."""
+    with pytest.raises(Exception) as exc_info:
+        await mcp_client.call_tool("financial_calcs", {**arguments, "rate": -1.0})
+    assert "rate != -1" in str(exc_info.value).lower()
 
 
 @pytest.mark.asyncio
-async def test_compound_interest_daily(mcp_client):
-    """Test compound interest with daily compounding."""
-    result = await mcp_client.call_tool(
-        "compound_interest",
-        {"principal": 2000, "rate": 0.04, "time": 1, "frequency": "daily"},
-    )
-    data = json.loads(result.content[0].text)
-    assert "result" in data
-    # Daily: n=365, A = 2000 * (1 + 0.04/365)^(365*1)
-    expected = 2000 * (1 + 0.04 / 365) ** (365 * 1)
-    assert abs(data["result"] - expected) < 0.01
+async def test_financial_npv_missing_cash_flows(mcp_client):
+    """Test error when NPV is calculated without cash flows."""
+    with pytest.raises(Exception) as exc_info:
+        await mcp_client.call_tool("financial_calcs", {"calculation": "npv", "rate": 0.1})
+    assert "requires" in str(exc_info.value).lower() or "cash_flows" in str(exc_info.value).lower()
 
 
-# ============================================================================
-# Comprehensive Real-World TVM Test Scenarios
-# ============================================================================
+@pytest.mark.asyncio
+async def test_financial_npv_rate_minus_one(mcp_client):
+    """Test error when the NPV discount rate is exactly -100%."""
+    with pytest.raises(Exception) as exc_info:
+        await mcp_client.call_tool(
+            "financial_calcs",
+            {"calculation": "npv", "rate": -1.0, "cash_flows": [-1000, 500, 600]},
+        )
+    assert "rate != -1" in str(exc_info.value).lower()
 
 
-# Section 1: Basic Lump Sum Problems
+@pytest.mark.asyncio
+async def test_financial_npv_rate_below_minus_one(mcp_client):
+    """Test that rates below -100% still evaluate, as npf.npv does."""
+    result = await mcp_client.call_tool(
+        "financial_calcs",
+        {"calculation": "npv", "rate": -1.5, "cash_flows": [-1000, 500, 600]},
+    )
+    data = unpack(result)
+    # Discount factor 1/(1 - 1.5) = -2: -1000 + 500×(-2) + 600×4 = 400
+    assert math.isclose(data["result"], 400.0, rel_tol=1e-9)
 
 
 @pytest.mark.asyncio
@@ -330,9 +329,9 @@ async def test_financial_fv_sales_growth(mcp_client):
         "financial_calcs",
         {"calculation": "fv", "rate": 0.08, "periods": 10, "present_value": -100, "payment": 0}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: $215.89 million
-    assert abs(data["result"] - 215.89) < 0.01
+    assert math.isclose(data["result"], 215.89, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -342,9 +341,9 @@ async def test_financial_pv_government_bond(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.04, "periods": 3, "future_value": 1000, "payment": 0}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: -$889.00 (negative = cash outflow to purchase)
-    assert abs(data["result"] - (-889.00)) < 0.01
+    assert math.isclose(data["result"], -889.00, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -354,9 +353,9 @@ async def test_financial_rate_treasury_bond(mcp_client):
         "financial_calcs",
         {"calculation": "rate", "periods": 10, "present_value": -613.81, "future_value": 1000}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: 5.00%
-    assert abs(data["result"] - 0.05) < 0.0001
+    assert math.isclose(data["result"], 0.05, abs_tol=0.0001)
 
 
 # Section 2: Annuity Problems
@@ -369,9 +368,9 @@ async def test_financial_pv_annuity_payment(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.06, "periods": 5, "payment": -1000, "future_value": 0}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: 4212.36 (amount you'd pay to receive the annuity)
-    assert abs(data["result"] - 4212.36) < 0.01
+    assert math.isclose(data["result"], 4212.36, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -381,9 +380,9 @@ async def test_financial_pmt_withdrawal(mcp_client):
         "financial_calcs",
         {"calculation": "pmt", "rate": 0.06, "periods": 15, "present_value": -200000, "future_value": 0}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: $20,592.55
-    assert abs(data["result"] - 20592.55) < 0.01
+    assert math.isclose(data["result"], 20592.55, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -393,9 +392,9 @@ async def test_financial_pmt_mortgage(mcp_client):
         "financial_calcs",
         {"calculation": "pmt", "rate": 0.07/12, "periods": 360, "present_value": -190000, "future_value": 0}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: $1,264 (approximately)
-    assert abs(data["result"] - 1264) < 1
+    assert math.isclose(data["result"], 1264, abs_tol=1)
 
 
 # Section 3: Bond Pricing Problems
@@ -408,9 +407,9 @@ async def test_financial_pv_zero_coupon_bond_100k(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.10, "periods": 4, "future_value": 100000, "payment": 0}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: -$68,301
-    assert abs(data["result"] - (-68301)) < 1
+    assert math.isclose(data["result"], -68301, abs_tol=1)
 
 
 @pytest.mark.asyncio
@@ -420,9 +419,9 @@ async def test_financial_pv_coupon_bond_annual(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.09, "periods": 15, "payment": 7000, "future_value": 100000}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: -$83,879 (bond trades at discount)
-    assert abs(data["result"] - (-83879)) < 1
+    assert math.isclose(data["result"], -83879, abs_tol=1)
 
 
 @pytest.mark.asyncio
@@ -432,10 +431,10 @@ async def test_financial_pv_coupon_bond_semiannual(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.07/2, "periods": 10, "payment": 4000, "future_value": 100000}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: -$104,158.30 (bond trades at premium)
     # Corrected from audit: Previous comment had wrong expected value of -$104,376
-    assert abs(data["result"] - (-104158.30)) < 1
+    assert math.isclose(data["result"], -104158.30, abs_tol=1)
 
 
 @pytest.mark.asyncio
@@ -446,9 +445,9 @@ async def test_financial_pv_bond_discount(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.03, "periods": 20, "payment": 25, "future_value": 1000}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: -$925.61 (trades at discount)
-    assert abs(data["result"] - (-925.61)) < 0.01
+    assert math.isclose(data["result"], -925.61, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -459,9 +458,9 @@ async def test_financial_pv_openstax_bond(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.025, "periods": 30, "payment": 20, "future_value": 1000}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: -$895.35
-    assert abs(data["result"] - (-895.35)) < 0.01
+    assert math.isclose(data["result"], -895.35, abs_tol=0.01)
 
 
 # Section 4: Uneven Cash Flow Problems
@@ -475,9 +474,9 @@ async def test_financial_npv_uneven_cashflows(mcp_client):
         "financial_calcs",
         {"calculation": "npv", "rate": 0.08, "cash_flows": cash_flows}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: $79,877
-    assert abs(data["result"] - 79877) < 1
+    assert math.isclose(data["result"], 79877, abs_tol=1)
 
 
 @pytest.mark.asyncio
@@ -488,9 +487,9 @@ async def test_financial_rate_savings_from_zero(mcp_client):
         "financial_calcs",
         {"calculation": "rate", "periods": 16, "payment": -30000, "present_value": 0, "future_value": 550000}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: ~1.79% per quarter
-    assert abs(data["result"] - 0.0179) < 0.001
+    assert math.isclose(data["result"], 0.0179, abs_tol=0.001)
     # Verify PV was included in metadata
     assert data["present_value"] == 0
 
@@ -503,7 +502,7 @@ async def test_financial_rate_annuity_due(mcp_client):
         "financial_calcs",
         {"calculation": "rate", "periods": 12, "payment": 59.88, "present_value": -399, "future_value": 0, "when": "begin"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Expected: ~13.1% monthly (~157% APR) for annuity due
     assert 0.12 < data["result"] < 0.14  # Between 12% and 14% monthly
     # Verify when parameter in metadata
@@ -518,7 +517,7 @@ async def test_financial_pmt_annuity_due(mcp_client):
         "financial_calcs",
         {"calculation": "pmt", "rate": 0.005, "periods": 36, "present_value": -20000, "future_value": 0, "when": "begin"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # Payment should be slightly less than ordinary annuity due to earlier compounding
     assert data["result"] > 0
     # Annuity due payment should be less than ordinary annuity
@@ -550,16 +549,16 @@ async def test_financial_deferred_annuity_cfa(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.08, "periods": 4, "payment": -20000, "future_value": 0}
     )
-    data_at_start = json.loads(result_at_start.content[0].text)
-    assert abs(data_at_start["result"] - 66242.54) < 0.01
+    data_at_start = unpack(result_at_start)
+    assert math.isclose(data_at_start["result"], 66242.54, abs_tol=0.01)
 
     # Step 2: Discount back to today
     result_today = await mcp_client.call_tool(
         "financial_calcs",
         {"calculation": "pv", "rate": 0.08, "periods": 3, "future_value": -data_at_start["result"], "payment": 0}
     )
-    data_today = json.loads(result_today.content[0].text)
-    assert abs(data_today["result"] - 52585.46) < 0.01
+    data_today = unpack(result_today)
+    assert math.isclose(data_today["result"], 52585.46, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -580,12 +579,12 @@ async def test_financial_negative_interest_rate_swiss_bond(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": -0.0008, "periods": 15, "future_value": 100, "payment": 0}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     # PV should be greater than FV (negative result represents cost)
     assert data["result"] < -101.00  # Negative because it's cash outflow
     assert data["result"] > -102.00
     # More precise check
-    assert abs(data["result"] - (-101.20)) < 0.01
+    assert math.isclose(data["result"], -101.20, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -607,8 +606,8 @@ async def test_financial_annuity_due_cfa_problem(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.04, "periods": 5, "payment": -300, "future_value": 0, "when": "begin"}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - 1388.97) < 0.01
+    data = unpack(result)
+    assert math.isclose(data["result"], 1388.97, abs_tol=0.01)
     # Verify when parameter in metadata
     assert data["when"] == "begin"
 
@@ -639,16 +638,16 @@ async def test_financial_balloon_payment_mortgage(mcp_client):
         "financial_calcs",
         {"calculation": "pmt", "rate": 0.07/12, "periods": 360, "present_value": -100000, "future_value": 0}
     )
-    data_pmt = json.loads(result_pmt.content[0].text)
-    assert abs(data_pmt["result"] - 665.30) < 0.01
+    data_pmt = unpack(result_pmt)
+    assert math.isclose(data_pmt["result"], 665.30, abs_tol=0.01)
 
     # Step 2: Calculate balloon (remaining balance after 60 payments)
     result_balloon = await mcp_client.call_tool(
         "financial_calcs",
         {"calculation": "fv", "rate": 0.07/12, "periods": 60, "payment": 665.30, "present_value": -100000}
     )
-    data_balloon = json.loads(result_balloon.content[0].text)
-    assert abs(data_balloon["result"] - 94131.59) < 1.00
+    data_balloon = unpack(result_balloon)
+    assert math.isclose(data_balloon["result"], 94131.59, abs_tol=1.00)
 
 
 @pytest.mark.asyncio
@@ -671,7 +670,7 @@ async def test_financial_deferred_annuity_changing_rates(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.15, "periods": 15, "payment": -750, "future_value": 0}
     )
-    data_at_yr5 = json.loads(result_at_yr5.content[0].text)
+    data_at_yr5 = unpack(result_at_yr5)
     # PV at year 5 should be approximately $4,372.56
     assert 4300 < data_at_yr5["result"] < 4400
 
@@ -680,7 +679,7 @@ async def test_financial_deferred_annuity_changing_rates(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.12, "periods": 5, "future_value": -data_at_yr5["result"], "payment": 0}
     )
-    data_today = json.loads(result_today.content[0].text)
+    data_today = unpack(result_today)
     # Final PV should be approximately $2,481
     assert 2400 < data_today["result"] < 2550
 
@@ -703,18 +702,18 @@ async def test_financial_mixed_cashflows_cfa(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.08, "periods": 3, "payment": 20000, "future_value": 0}
     )
-    data_annuity = json.loads(result_annuity.content[0].text)
+    data_annuity = unpack(result_annuity)
 
     # Lump sum component (30,000 at year 4 received)
     result_lumpsum = await mcp_client.call_tool(
         "financial_calcs",
         {"calculation": "pv", "rate": 0.08, "periods": 4, "future_value": 30000, "payment": 0}
     )
-    data_lumpsum = json.loads(result_lumpsum.content[0].text)
+    data_lumpsum = unpack(result_lumpsum)
 
     # Total PV (take absolute values since we want the instrument's value)
     total_pv = abs(data_annuity["result"]) + abs(data_lumpsum["result"])
-    assert abs(total_pv - 73592.83) < 0.01
+    assert math.isclose(total_pv, 73592.83, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -736,8 +735,8 @@ async def test_financial_bond_semiannual_cfa(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.025, "periods": 4, "payment": 30, "future_value": 1000}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - (-1018.81)) < 0.01
+    data = unpack(result)
+    assert math.isclose(data["result"], -1018.81, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -759,8 +758,8 @@ async def test_financial_bond_at_discount_cfa(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.0425, "periods": 20, "payment": 3.9, "future_value": 100}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - (-95.35)) < 0.01
+    data = unpack(result)
+    assert math.isclose(data["result"], -95.35, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -778,8 +777,8 @@ async def test_financial_zero_coupon_fv_cfa(mcp_client):
         "financial_calcs",
         {"calculation": "fv", "rate": 0.08, "periods": 4, "present_value": -8000, "payment": 0}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - 10883.91) < 0.01
+    data = unpack(result)
+    assert math.isclose(data["result"], 10883.91, abs_tol=0.01)
 
 
 @pytest.mark.asyncio
@@ -796,8 +795,8 @@ async def test_financial_ordinary_annuity_cfa_validation(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.05, "periods": 10, "payment": -2000, "future_value": 0, "when": "end"}
     )
-    data = json.loads(result.content[0].text)
-    assert abs(data["result"] - 15443.47) < 0.01
+    data = unpack(result)
+    assert math.isclose(data["result"], 15443.47, abs_tol=0.01)
 
 
 # ============================================================================
@@ -821,9 +820,9 @@ async def test_financial_perpetuity_monthly_cfa(mcp_client):
         "perpetuity",
         {"payment": 1000, "rate": 0.005}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
-    assert abs(data["result"] - 200000.00) < 0.01
+    assert math.isclose(data["result"], 200000.00, abs_tol=0.01)
     # Verify metadata
     assert data["type"] == "level_ordinary"
     assert data["payment"] == 1000
@@ -848,9 +847,9 @@ async def test_financial_perpetuity_quarterly(mcp_client):
         "perpetuity",
         {"payment": 5, "rate": 0.0175}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
-    assert abs(data["result"] - 285.71) < 0.01
+    assert math.isclose(data["result"], 285.71, abs_tol=0.01)
     # Verify metadata
     assert data["type"] == "level_ordinary"
 
@@ -880,14 +879,14 @@ async def test_financial_growing_annuity_salary(mcp_client):
         "financial_calcs",
         {"calculation": "pv", "rate": 0.12, "periods": 25, "payment": -45000, "growth_rate": 0.035}
     )
-    data_salary = json.loads(result_salary.content[0].text)
+    data_salary = unpack(result_salary)
 
     # Bonus component (10% of salary)
     result_bonus = await mcp_client.call_tool(
         "financial_calcs",
         {"calculation": "pv", "rate": 0.12, "periods": 25, "payment": -4500, "growth_rate": 0.035}
     )
-    data_bonus = json.loads(result_bonus.content[0].text)
+    data_bonus = unpack(result_bonus)
 
     # Total PV
     total_pv = data_salary["result"] + data_bonus["result"] + 10000
@@ -1,8 +1,9 @@
 """Tests for linear algebra tools."""
 
-import json
 import pytest
 
+from ._responses import unpack
+
 
 @pytest.mark.asyncio
 async def test_matrix_multiply(mcp_client, sample_array_2x2):
@@ -11,7 +12,7 @@ async def test_matrix_multiply(mcp_client, sample_array_2x2):
         "matrix_operations",
         {"operation": "multiply", "matrix1": sample_array_2x2, "matrix2": sample_array_2x2},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # [[1,2],[3,4]] * [[1,2],[3,4]] = [[7,10],[15,22]]
     assert data["result"] == [[7.0, 10.0], [15.0, 22.0]]
@@ -23,7 +24,7 @@ async def test_matrix_transpose(mcp_client, sample_array_2x2):
     result = await mcp_client.call_tool(
         "matrix_operations", {"operation": "transpose", "matrix1": sample_array_2x2}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert data["result"] == [[1.0, 3.0], [2.0, 4.0]]
 
@@ -34,7 +35,7 @@ async def test_matrix_determinant(mcp_client, sample_array_2x2):
     result = await mcp_client.call_tool(
         "matrix_operations", {"operation": "determinant", "matrix1": sample_array_2x2}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # det([[1,2],[3,4]]) = 1*4 - 2*3 = -2
     assert abs(data["result"] - (-2.0)) < 1e-10
@@ -46,7 +47,7 @@ async def test_matrix_trace(mcp_client, sample_array_2x2):
     result = await mcp_client.call_tool(
         "matrix_operations", {"operation": "trace", "matrix1": sample_array_2x2}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # trace([[1,2],[3,4]]) = 1 + 4 = 5
     assert data["result"] == 5.0
@@ -63,7 +64,7 @@ async def test_solve_linear_system(mcp_client):
         "solve_linear_system",
         {"coefficients": coefficients, "constants": constants, "method": "direct"},
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # Solution: x=1, y=2
     assert abs(data["result"][0] - 1.0) < 1e-10
@@ -76,7 +77,7 @@ async def test_matrix_decomposition_svd(mcp_client, sample_array_2x2):
     result = await mcp_client.call_tool(
         "matrix_decomposition", {"matrix": sample_array_2x2, "decomposition": "svd"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "U" in data["result"]
     assert "singular_values" in data["result"]
@@ -89,7 +90,7 @@ async def test_matrix_decomposition_qr(mcp_client, sample_array_2x2):
     result = await mcp_client.call_tool(
         "matrix_decomposition", {"matrix": sample_array_2x2, "decomposition": "qr"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "Q" in data["result"]
     assert "R" in data["result"]
@@ -102,7 +103,7 @@ async def test_matrix_inverse_2x2(mcp_client):
     result = await mcp_client.call_tool(
         "matrix_operations", {"operation": "inverse", "matrix1": matrix}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # Verify inverse exists and has correct shape
     assert len(data["result"]) == 2
@@ -118,7 +119,7 @@ async def test_matrix_inverse_3x3(mcp_client):
     result = await mcp_client.call_tool(
         "matrix_operations", {"operation": "inverse", "matrix1": matrix}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     # Verify inverse has correct shape
     assert len(data["result"]) == 3
@@ -240,7 +241,7 @@ async def test_matrix_decomposition_eigen_2x2(mcp_client):
     result = await mcp_client.call_tool(
         "matrix_decomposition", {"matrix": matrix, "decomposition": "eigen"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "eigenvalues" in data["result"]
     assert "eigenvectors" in data["result"]
@@ -254,7 +255,7 @@ async def test_matrix_decomposition_eigen_3x3(mcp_client):
     result = await mcp_client.call_tool(
         "matrix_decomposition", {"matrix": matrix, "decomposition": "eigen"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert len(data["result"]["eigenvalues"]) == 3
     assert len(data["result"]["eigenvectors"]) == 3
@@ -279,7 +280,7 @@ async def test_matrix_decomposition_cholesky_positive_definite(mcp_client):
     result = await mcp_client.call_tool(
         "matrix_decomposition", {"matrix": matrix, "decomposition": "cholesky"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "L" in data["result"]
     assert len(data["result"]["L"]) == 2
@@ -315,7 +316,7 @@ async def test_matrix_decomposition_lu_2x2(mcp_client):
     result = await mcp_client.call_tool(
         "matrix_decomposition", {"matrix": matrix, "decomposition": "lu"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert "P" in data["result"]
     assert "L" in data["result"]
@@ -330,7 +331,7 @@ async def test_matrix_decomposition_lu_3x3(mcp_client):
     result = await mcp_client.call_tool(
         "matrix_decomposition", {"matrix": matrix, "decomposition": "lu"}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "result" in data
     assert len(data["result"]["P"]) == 3
     assert len(data["result"]["L"]) == 3
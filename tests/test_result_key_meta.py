@@ -4,9 +4,10 @@ This test ensures architectural consistency across the entire tool suite.
 Every tool MUST return a response with a 'result' key as the primary output field.
 """
 
-import json
 import pytest
 
+from ._responses import unpack
+
 
 # Complete tool registry with minimal valid inputs for all 21 tools
 TOOL_TEST_CASES = {
@@ -76,7 +77,7 @@ async def test_all_tools_return_result_key(mcp_client, tool_name, arguments):
     - Breaking change to tool output structure
     """
     result = await mcp_client.call_tool(tool_name, arguments)
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
 
     # Explicit validation that 'result' key exists
     assert "result" in data, (
@@ -1,8 +1,9 @@
 """Tests for statistical analysis tools."""
 
-import json
 import pytest
 
+from ._responses import unpack
+
 
 @pytest.mark.asyncio
 async def test_statistics_describe(mcp_client, sample_data_list):
@@ -10,7 +11,7 @@ async def test_statistics_describe(mcp_client, sample_data_list):
     result = await mcp_client.call_tool(
         "statistics", {"data": sample_data_list, "analyses": ["describe"]}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert data["result"]["describe"]["count"] == 10
     assert data["result"]["describe"]["mean"] == 5.5
     assert data["result"]["describe"]["min"] == 1.0
@@ -23,7 +24,7 @@ async def test_statistics_quartiles(mcp_client, sample_data_list):
     result = await mcp_client.call_tool(
         "statistics", {"data": sample_data_list, "analyses": ["quartiles"]}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert "Q1" in data["result"]["quartiles"]
     assert "Q2" in data["result"]["quartiles"]
     assert "Q3" in data["result"]["quartiles"]
@@ -37,7 +38,7 @@ async def test_statistics_outliers(mcp_client):
     result = await mcp_client.call_tool(
         "statistics", {"data": data_with_outliers, "analyses": ["outliers"]}
     )
-    data = json.loads(result.content[0].text)
+    data = unpack(result)
     assert len(data["result"]["outliers"]["outlier_values"]) > 0
 
 
@@ -60,7 +61,7 @@ async def test_pivot_table(mcp_client):
             "aggfunc": "sum",
         },
     )
-    result_data = json.loads(result.content[0].text)
+    result_data = unpack(result)
     assert "result" in result_data
 
 
@@ -75,7 +76,7 @@ async def test_correlation_pearson(mcp_client):
     result = await mcp_client.call_tool(
         "correlation", {"data": data, "method": "pearson", "output_format": "matrix"}
     )
-    result_data = json.loads(result.content[0].text)
+    result_data = unpack(result)
     assert "result" in result_data
     # x and y should be perfectly correlated
     assert (
@@ -93,7 +94,7 @@ async def test_correlation_spearman(mcp_client):
     result = await mcp_client.call_tool(
         "correlation", {"data": data, "method": "spearman", "output_format": "matrix"}
     )
-    result_data = json.loads(result.content[0].text)
+    result_data = unpack(result)
     assert "result" in result_data
     # Spearman correlation should be perfect for monotonic relationship
     assert abs(result_data["result"]["x"]["y"] - 1.0) < 1e-10
@@ -110,7 +111,7 @@ async def test_correlation_pairs_format(mcp_client):
     result = await mcp_client.call_tool(
         "correlation", {"data": data, "method": "pearson", "output_format": "pairs"}
     )
-    result_data = json.loads(result.content[0].text)
+    result_data = unpack(result)
     assert "result" in result_data
     # Should return pairwise correlations
     assert isinstance(result_data["result"], list)
@@ -151,7 +152,7 @@ async def test_pivot_table_mean_aggfunc(mcp_client):
             "aggfunc": "mean",
         },
     )
-    result_data = json.loads(result.content[0].text)
+    result_data = unpack(result)
     assert "result" in result_data
 
 
@@ -173,7 +174,7 @@ async def test_pivot_table_count_aggfunc(mcp_client):
             "aggfunc": "count",
         },
     )
-    result_data = json.loads(result.content[0].text)
+    result_data = unpack(result)
     assert "result" in result_data
 
 
@@ -205,7 +206,7 @@ async def test_statistics_combined_analyses(mcp_client):
     result = await mcp_client.call_tool(
         "statistics", {"data": data, "analyses": ["describe", "quartiles", "outliers"]}
     )
-    result_data = json.loads(result.content[0].text)
+    result_data = unpack(result)
     # All three analyses should be present
     assert "describe" in result_data["result"]
     assert "quartiles" in result_data["result"]